@@ -1,4 +1,6 @@
+import random
 from sklearn.cluster import KMeans
+from scipy.optimize import linear_sum_assignment
 import numpy as np
 
 def cluster_prey_traits(prey_list, n_clusters: int):
@@ -10,7 +12,52 @@ def cluster_prey_traits(prey_list, n_clusters: int):
     if len(X) < n_clusters:
         return None, None
 
-    kmeans = KMeans(n_clusters=n_clusters, n_init="auto")
+    kmeans = KMeans(n_clusters=n_clusters, n_init="auto", random_state=random.getrandbits(32))
     labels = kmeans.fit_predict(X)
     centroids = kmeans.cluster_centers_
     return labels, centroids
+
+
+class IncrementalClusterer:
+    """K-means over prey traits that warm-starts from its last centroids.
+
+    Clusters keep their index from one run to the next: after fitting, the
+    new centroids are matched to the previous ones (Hungarian assignment on
+    distance), so cluster i can be followed across generations.
+    """
+
+    def __init__(self, n_clusters: int, interval: int = 1):
+        self.n_clusters = n_clusters
+        self.interval = max(1, interval)
+        self.centroids = None
+        self.labels = None
+        self.history = []  # (generation, centroids) per run
+
+    def due(self, gen: int) -> bool:
+        return gen % self.interval == 0
+
+    def update(self, prey_list, gen: int):
+        """Re-cluster the current prey; returns (labels, centroids, drift)."""
+        X = np.array([[p.traits["speed"], p.traits["agility"], p.traits["vision"]] for p in prey_list])
+        if len(X) < self.n_clusters:
+            return None, None, None
+
+        if self.centroids is None:
+            # Seeded from the simulation RNG so seeded and resumed runs log the same clusters
+            kmeans = KMeans(n_clusters=self.n_clusters, n_init="auto", random_state=random.getrandbits(32))
+        else:
+            kmeans = KMeans(n_clusters=self.n_clusters, init=self.centroids, n_init=1)
+        labels = kmeans.fit_predict(X)
+        centroids = kmeans.cluster_centers_
+
+        drift = None
+        if self.centroids is not None:
+            cost = np.linalg.norm(self.centroids[:, None, :] - centroids[None, :, :], axis=2)
+            _, order = linear_sum_assignment(cost)
+            centroids = centroids[order]
+            labels = np.argsort(order)[labels]
+            drift = np.linalg.norm(centroids - self.centroids, axis=1)
+
+        self.centroids, self.labels = centroids, labels
+        self.history.append((gen, centroids.copy()))
+        return labels, centroids, drift
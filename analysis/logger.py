@@ -1,7 +1,23 @@
 import os
+import csv
 import json
+from analysis.run_store import RunLogWriter
+
+_run_writers = {}
+
+def _columnar_writer(config: dict, gen: int) -> RunLogWriter:
+    run_dir = os.path.join(config["log_dir"], "run")
+    writer = _run_writers.get(run_dir)
+    if writer is None or gen == 0:
+        # A new run starts over; otherwise keep appending to what is on disk
+        writer = _run_writers[run_dir] = RunLogWriter(run_dir, fresh=gen == 0)
+    return writer
 
 def log_generation(env, gen: int, config: dict):
+    if config.get("log_format", "json") == "columnar":
+        _columnar_writer(config, gen).append(env, gen)
+        return
+
     os.makedirs(config["log_dir"], exist_ok=True)
     log_path = os.path.join(config["log_dir"], f"gen_{gen+1}.json")
 
@@ -25,10 +41,34 @@ def log_generation(env, gen: int, config: dict):
         "prey_data": prey_traits,
         "predator_data": predator_data
     }
+    if env.generation_stats:
+        record["stats"] = env.generation_stats
 
     with open(log_path, "w") as f:
         json.dump(record, f, indent=2)
 
+def summarize_generation(env, gen: int) -> dict:
+    """One flat row of per-generation numbers, for results tables."""
+    rewards = [pr.total_reward for pr in env.predators]
+    row = {"generation": gen + 1}
+    # Nested stats (clusters, profile) stay in the JSON logs; table cells get scalars only
+    row.update({k: v for k, v in env.generation_stats.items() if isinstance(v, (int, float, str))})
+    row["avg_predator_reward"] = sum(rewards) / len(rewards) if rewards else 0.0
+    prey = env.prey
+    for trait in ("speed", "agility", "vision"):
+        row[f"mean_{trait}"] = sum(p.traits[trait] for p in prey) / len(prey) if prey else 0.0
+    return row
+
+def write_summary_csv(rows: list, path: str):
+    fields = []
+    for row in rows:
+        fields.extend(k for k in row if k not in fields)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(rows)
+
 def dummy_logger(env, gen, config):
     alive_count = sum(1 for p in env.prey if p.alive)
     avg_reward = sum(pr.total_reward for pr in env.predators) / len(env.predators)
@@ -0,0 +1,84 @@
+import multiprocessing as mp
+import queue
+
+PLOTS = {
+    "reward_curve": "plot_reward_curve",
+    "trait_distribution": "plot_trait_distribution",
+    "cluster_centroids": "plot_cluster_centroids",
+}
+
+
+def _draw(kind: str, args: tuple):
+    from analysis import visualization
+    getattr(visualization, PLOTS[kind])(*args)
+
+
+def _plot_loop(queue):
+    """Draw queued plots until the None sentinel arrives."""
+    while True:
+        job = queue.get()
+        if job is None:
+            break
+        kind, args = job
+        try:
+            _draw(kind, args)
+        except Exception as e:
+            print(f"Plotting {kind} failed: {e}")
+
+
+class InlinePlotter:
+    """Draws every plot immediately on the calling thread."""
+
+    def submit(self, kind: str, *args):
+        _draw(kind, args)
+
+    def close(self):
+        pass
+
+
+class PlotWorker:
+    """Draws plots in a separate process fed through a bounded queue.
+
+    `submit` only pickles the arguments onto the queue, blocking if the
+    worker falls `queue_size` plots behind; `close` waits for the queue
+    to drain. If the worker process dies, plots are drawn inline from
+    then on instead of blocking on a queue nobody reads.
+    """
+
+    def __init__(self, queue_size: int = 8, put_timeout: float = 1.0):
+        ctx = mp.get_context("spawn")
+        self.queue = ctx.Queue(queue_size)
+        self.put_timeout = put_timeout
+        self.process = ctx.Process(target=_plot_loop, args=(self.queue,), daemon=True)
+        self.process.start()
+        self.fallback = None
+
+    def submit(self, kind: str, *args):
+        if kind not in PLOTS:
+            raise ValueError(f"Unknown plot {kind!r}")
+        if self.fallback is None and self._put((kind, args)):
+            return
+        if self.fallback is None:
+            print(f"Plot worker exited (code {self.process.exitcode}); drawing plots inline")
+            self.fallback = InlinePlotter()
+        self.fallback.submit(kind, *args)
+
+    def _put(self, job) -> bool:
+        """Queue `job`, waiting while the worker is alive; False once it is gone."""
+        while self.process.is_alive():
+            try:
+                self.queue.put(job, timeout=self.put_timeout)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def close(self):
+        if self._put(None):
+            self.process.join()
+
+
+def make_plotter(config: dict):
+    if config.get("async_plots", True):
+        return PlotWorker(config.get("plot_queue_size", 8))
+    return InlinePlotter()
@@ -0,0 +1,93 @@
+import time
+from contextlib import nullcontext
+
+
+class _Phase:
+    __slots__ = ("samples", "start")
+
+    def __init__(self, samples: list):
+        self.samples = samples
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc):
+        self.samples.append((time.perf_counter() - self.start) * 1000.0)
+
+
+class PhaseProfiler:
+    """Wall-clock timings per named phase, summarised once per generation."""
+
+    enabled = True
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.samples = {}
+        self.steps = 0
+        self.start_steps()
+
+    def start_steps(self):
+        self.started = self.last_step = time.perf_counter()
+
+    def phase(self, name: str):
+        samples = self.samples.get(name)
+        if samples is None:
+            samples = self.samples[name] = []
+        return _Phase(samples)
+
+    def step(self):
+        self.steps += 1
+        self.last_step = time.perf_counter()
+
+    def summary(self) -> dict:
+        phases = {}
+        for name, samples in self.samples.items():
+            ordered = sorted(samples)
+            phases[name] = {
+                "calls": len(samples),
+                "mean_ms": sum(samples) / len(samples),
+                "p95_ms": ordered[int(0.95 * (len(ordered) - 1))],
+                "total_ms": sum(samples),
+            }
+        elapsed = self.last_step - self.started
+        return {
+            "steps": self.steps,
+            "steps_per_sec": self.steps / elapsed if elapsed > 0 else 0.0,
+            "phases": phases,
+        }
+
+
+class NullProfiler:
+    """Drop-in for PhaseProfiler when profiling is off; every call is a no-op."""
+
+    enabled = False
+    _null = nullcontext()
+
+    def reset(self):
+        pass
+
+    def start_steps(self):
+        pass
+
+    def phase(self, name: str):
+        return self._null
+
+    def step(self):
+        pass
+
+    def summary(self) -> dict:
+        return {}
+
+
+def make_profiler(config: dict):
+    return PhaseProfiler() if config.get("profile", False) else NullProfiler()
+
+
+def print_profile(gen: int, summary: dict):
+    if not summary:
+        return
+    slowest = sorted(summary["phases"].items(), key=lambda kv: kv[1]["total_ms"], reverse=True)[:3]
+    parts = ", ".join(f"{name} {stats['mean_ms']:.3f}ms (p95 {stats['p95_ms']:.3f})" for name, stats in slowest)
+    print(f"Gen {gen+1} profile: {summary['steps_per_sec']:.0f} steps/s | {parts}")
@@ -0,0 +1,193 @@
+import argparse
+import json
+import os
+import numpy as np
+from core.world_state import TRAIT_NAMES
+
+# Full precision, so export_legacy_json reproduces the JSON logs exactly
+PREY_COLUMNS = {
+    "speed": np.float64,
+    "agility": np.float64,
+    "vision": np.float64,
+    "fitness": np.float64,
+    "alive": np.bool_,
+}
+PREDATOR_COLUMNS = {
+    "total_reward": np.float64,
+}
+MANIFEST = "manifest.json"
+
+
+def gather_columns(env) -> tuple:
+    """Per-generation prey and predator columns as NumPy arrays."""
+    if hasattr(env, "prey_columns"):
+        prey = env.prey_columns()
+    else:
+        prey_list = env.prey
+        prey = {t: np.array([p.traits[t] for p in prey_list], PREY_COLUMNS[t]) for t in TRAIT_NAMES}
+        prey["fitness"] = np.array([p.fitness for p in prey_list], PREY_COLUMNS["fitness"])
+        prey["alive"] = np.array([p.alive for p in prey_list], PREY_COLUMNS["alive"])
+    predators = {"total_reward": np.array([pr.total_reward for pr in env.predators], PREDATOR_COLUMNS["total_reward"])}
+    return prey, predators
+
+
+class RunLogWriter:
+    """Append-only columnar run log.
+
+    Every column is one raw little-endian binary file that grows by one
+    chunk per generation; ``manifest.json`` records dtypes and where each
+    generation's rows start.
+    """
+
+    def __init__(self, run_dir: str, fresh: bool = True):
+        self.run_dir = run_dir
+        os.makedirs(run_dir, exist_ok=True)
+        manifest_path = os.path.join(run_dir, MANIFEST)
+        if not fresh and os.path.exists(manifest_path):
+            with open(manifest_path) as f:
+                self.manifest = json.load(f)
+            return
+
+        for name in list(PREY_COLUMNS) + list(PREDATOR_COLUMNS):
+            path = self._column_path(name)
+            if os.path.exists(path):
+                os.remove(path)
+        self.manifest = {
+            "prey_columns": {name: np.dtype(dtype).str for name, dtype in PREY_COLUMNS.items()},
+            "predator_columns": {name: np.dtype(dtype).str for name, dtype in PREDATOR_COLUMNS.items()},
+            "prey_rows": 0,
+            "predator_rows": 0,
+            "generations": [],
+        }
+        self._write_manifest()
+
+    def _column_path(self, name: str) -> str:
+        return os.path.join(self.run_dir, f"{name}.bin")
+
+    def _write_manifest(self):
+        path = os.path.join(self.run_dir, MANIFEST)
+        with open(path + ".tmp", "w") as f:
+            json.dump(self.manifest, f)
+        os.replace(path + ".tmp", path)
+
+    def _append(self, columns: dict, dtypes: dict):
+        for name, dtype in dtypes.items():
+            with open(self._column_path(name), "ab") as f:
+                f.write(np.ascontiguousarray(columns[name], dtype=np.dtype(dtype).newbyteorder("<")).tobytes())
+
+    def truncate(self, generations: int):
+        """Drop everything logged after the first `generations` generations."""
+        entries = self.manifest["generations"]
+        keep = [e for e in entries if e["generation"] <= generations]
+        if len(keep) == len(entries):
+            return
+        first = entries[len(keep)]
+        self.manifest["generations"] = keep
+        self.manifest["prey_rows"] = first["prey_offset"]
+        self.manifest["predator_rows"] = first["predator_offset"]
+        for dtypes, rows in ((PREY_COLUMNS, first["prey_offset"]), (PREDATOR_COLUMNS, first["predator_offset"])):
+            for name, dtype in dtypes.items():
+                os.truncate(self._column_path(name), rows * np.dtype(dtype).itemsize)
+        self._write_manifest()
+
+    def append(self, env, gen: int):
+        # A resumed run re-logs generations from its checkpoint on; replace them
+        self.truncate(gen)
+        prey, predators = gather_columns(env)
+        self._append(prey, PREY_COLUMNS)
+        self._append(predators, PREDATOR_COLUMNS)
+
+        n_prey = len(prey["alive"])
+        n_pred = len(predators["total_reward"])
+        self.manifest["generations"].append({
+            "generation": gen + 1,
+            "prey_offset": self.manifest["prey_rows"],
+            "prey_count": n_prey,
+            "predator_offset": self.manifest["predator_rows"],
+            "predator_count": n_pred,
+            "num_prey_alive": int(prey["alive"].sum()),
+            "stats": env.generation_stats,
+        })
+        self.manifest["prey_rows"] += n_prey
+        self.manifest["predator_rows"] += n_pred
+        self._write_manifest()
+
+
+class RunLogReader:
+    """Memory-mapped access to a run written by RunLogWriter."""
+
+    def __init__(self, run_dir: str):
+        self.run_dir = run_dir
+        with open(os.path.join(run_dir, MANIFEST)) as f:
+            self.manifest = json.load(f)
+        self._columns = {}
+
+    @property
+    def generations(self) -> list:
+        return self.manifest["generations"]
+
+    def column(self, name: str) -> np.ndarray:
+        """The whole column across every generation, memory-mapped."""
+        if name not in self._columns:
+            if name in self.manifest["prey_columns"]:
+                dtype, rows = self.manifest["prey_columns"][name], self.manifest["prey_rows"]
+            else:
+                dtype, rows = self.manifest["predator_columns"][name], self.manifest["predator_rows"]
+            path = os.path.join(self.run_dir, f"{name}.bin")
+            self._columns[name] = np.memmap(path, dtype=np.dtype(dtype), mode="r", shape=(rows,)) if rows else np.zeros(0, dtype)
+        return self._columns[name]
+
+    def generation(self, index: int) -> dict:
+        """Column slices for the index-th logged generation."""
+        entry = self.generations[index]
+        prey = slice(entry["prey_offset"], entry["prey_offset"] + entry["prey_count"])
+        predators = slice(entry["predator_offset"], entry["predator_offset"] + entry["predator_count"])
+        data = {name: self.column(name)[prey] for name in self.manifest["prey_columns"]}
+        data.update({name: self.column(name)[predators] for name in self.manifest["predator_columns"]})
+        return data
+
+    def legacy_record(self, index: int) -> dict:
+        """The generation in the per-generation JSON layout of `log_generation`."""
+        entry = self.generations[index]
+        data = self.generation(index)
+        prey_data = [
+            {
+                "traits": {t: float(data[t][i]) for t in TRAIT_NAMES},
+                "fitness": float(data["fitness"][i]),
+                "alive": bool(data["alive"][i]),
+            }
+            for i in range(entry["prey_count"])
+        ]
+        record = {
+            "generation": entry["generation"],
+            "num_prey_alive": entry["num_prey_alive"],
+            "prey_data": prey_data,
+            "predator_data": [{"total_reward": float(r)} for r in data["total_reward"]],
+        }
+        if entry["stats"]:
+            record["stats"] = entry["stats"]
+        return record
+
+
+def export_legacy_json(run_dir: str, out_dir: str):
+    """Write a gen_N.json file per generation, as the JSON logger would have."""
+    reader = RunLogReader(run_dir)
+    os.makedirs(out_dir, exist_ok=True)
+    for index, entry in enumerate(reader.generations):
+        with open(os.path.join(out_dir, f"gen_{entry['generation']}.json"), "w") as f:
+            json.dump(reader.legacy_record(index), f, indent=2)
+    return len(reader.generations)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert a columnar run log into per-generation JSON files.")
+    parser.add_argument("run_dir")
+    parser.add_argument("--out", default=None, help="defaults to the run directory's parent")
+    args = parser.parse_args()
+    out_dir = args.out or os.path.dirname(os.path.abspath(args.run_dir))
+    count = export_legacy_json(args.run_dir, out_dir)
+    print(f"Wrote {count} generation files to {out_dir}")
+
+
+if __name__ == "__main__":
+    main()
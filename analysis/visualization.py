@@ -1,15 +1,26 @@
-import matplotlib.pyplot as plt
 import os
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+# One Agg figure per plot name, cleared and redrawn instead of recreated
+_figures = {}
+
+def _axes(name: str):
+    fig = _figures.get(name)
+    if fig is None:
+        fig = _figures[name] = Figure()
+        FigureCanvasAgg(fig)
+    fig.clf()
+    return fig, fig.add_subplot()
 
 def plot_reward_curve(reward_history, config):
     os.makedirs(config["plot_dir"], exist_ok=True)
-    plt.figure()
-    plt.plot(range(1, len(reward_history) + 1), reward_history, marker="o")
-    plt.title("Average Predator Reward per Generation")
-    plt.xlabel("Generation")
-    plt.ylabel("Average Reward")
-    plt.savefig(os.path.join(config["plot_dir"], "predator_reward_curve.png"))
-    plt.close()
+    fig, ax = _axes("reward_curve")
+    ax.plot(range(1, len(reward_history) + 1), reward_history, marker="o")
+    ax.set_title("Average Predator Reward per Generation")
+    ax.set_xlabel("Generation")
+    ax.set_ylabel("Average Reward")
+    fig.savefig(os.path.join(config["plot_dir"], "predator_reward_curve.png"))
 
 def plot_trait_distribution(prey_data, gen: int, config: dict):
     speeds = [p["traits"]["speed"] for p in prey_data]
@@ -17,46 +28,41 @@ def plot_trait_distribution(prey_data, gen: int, config: dict):
     visions = [p["traits"]["vision"] for p in prey_data]
 
     os.makedirs(config["plot_dir"], exist_ok=True)
-    plt.figure()
-    plt.hist(speeds, bins=10, color="blue", alpha=0.7)
-    plt.title(f"Generation {gen+1} – Speed Distribution")
-    plt.xlabel("Speed")
-    plt.ylabel("Count")
-    plt.savefig(os.path.join(config["plot_dir"], f"speed_dist_gen{gen+1}.png"))
-    plt.close()
-
-    plt.figure()
-    plt.hist(agilities, bins=10, color="green", alpha=0.7)
-    plt.title(f"Generation {gen+1} – Agility Distribution")
-    plt.xlabel("Agility")
-    plt.ylabel("Count")
-    plt.savefig(os.path.join(config["plot_dir"], f"agility_dist_gen{gen+1}.png"))
-    plt.close()
-
-    plt.figure()
-    plt.hist(visions, bins=10, color="orange", alpha=0.7)
-    plt.title(f"Generation {gen+1} – Vision Distribution")
-    plt.xlabel("Vision")
-    plt.ylabel("Count")
-    plt.savefig(os.path.join(config["plot_dir"], f"vision_dist_gen{gen+1}.png"))
-    plt.close()
+    fig, ax = _axes("speed_dist")
+    ax.hist(speeds, bins=10, color="blue", alpha=0.7)
+    ax.set_title(f"Generation {gen+1} – Speed Distribution")
+    ax.set_xlabel("Speed")
+    ax.set_ylabel("Count")
+    fig.savefig(os.path.join(config["plot_dir"], f"speed_dist_gen{gen+1}.png"))
+
+    fig, ax = _axes("agility_dist")
+    ax.hist(agilities, bins=10, color="green", alpha=0.7)
+    ax.set_title(f"Generation {gen+1} – Agility Distribution")
+    ax.set_xlabel("Agility")
+    ax.set_ylabel("Count")
+    fig.savefig(os.path.join(config["plot_dir"], f"agility_dist_gen{gen+1}.png"))
+
+    fig, ax = _axes("vision_dist")
+    ax.hist(visions, bins=10, color="orange", alpha=0.7)
+    ax.set_title(f"Generation {gen+1} – Vision Distribution")
+    ax.set_xlabel("Vision")
+    ax.set_ylabel("Count")
+    fig.savefig(os.path.join(config["plot_dir"], f"vision_dist_gen{gen+1}.png"))
 
 def plot_cluster_centroids(centroids, gen: int, config: dict):
     if centroids is None:
         return
 
     os.makedirs(config["plot_dir"], exist_ok=True)
-    import numpy as np
     speeds = centroids[:, 0]
     agilities = centroids[:, 1]
     visions = centroids[:, 2]
 
-    plt.figure()
-    plt.scatter(speeds, agilities, c="red", marker="x")
+    fig, ax = _axes("centroids")
+    ax.scatter(speeds, agilities, c="red", marker="x")
     for i, (s, a) in enumerate(zip(speeds, agilities)):
-        plt.text(s, a, f"C{i}")
-    plt.title(f"Generation {gen+1} – Cluster Centroids (Speed vs Agility)")
-    plt.xlabel("Speed")
-    plt.ylabel("Agility")
-    plt.savefig(os.path.join(config["plot_dir"], f"centroids_gen{gen+1}.png"))
-    plt.close()
+        ax.text(s, a, f"C{i}")
+    ax.set_title(f"Generation {gen+1} – Cluster Centroids (Speed vs Agility)")
+    ax.set_xlabel("Speed")
+    ax.set_ylabel("Agility")
+    fig.savefig(os.path.join(config["plot_dir"], f"centroids_gen{gen+1}.png"))
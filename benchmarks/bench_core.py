@@ -0,0 +1,160 @@
+import argparse
+import contextlib
+import copy
+import io
+import json
+import os
+import platform
+import random
+import sys
+import time
+from datetime import datetime
+import numpy as np
+from config import CONFIG
+from core.clock import SimClock
+from analysis.clustering import cluster_prey_traits
+from logic.evolution import evolve_prey
+from logic.simulation import populate_environment, run_generation, next_generation
+from logic.vector_simulation import build_world, encode_states, step_world
+
+DEFAULT_SIZES = [20, 200, 2000, 20000]
+
+
+def bench_config(n_prey: int, steps: int) -> dict:
+    config = copy.deepcopy(CONFIG)
+    config.update(num_prey=n_prey, time_steps_per_generation=steps, headless=True)
+    # Keep density comparable as the population grows
+    scale = max(1.0, (n_prey / CONFIG["num_prey"]) ** 0.5)
+    w, h = CONFIG["world_size"]
+    config["world_size"] = (int(w * scale), int(h * scale))
+    return config
+
+
+def timed(func, repeats: int) -> dict:
+    """Run func `repeats` times and report min/mean wall time in ms."""
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return {"min_ms": min(samples), "mean_ms": sum(samples) / len(samples), "repeats": repeats}
+
+
+def make_env(config: dict, seed: int):
+    random.seed(seed)
+    env = populate_environment(config, SimClock(config["tick_ms"]))
+    # Spread prey over the whole world instead of the spawn square
+    w, h = config["world_size"]
+    for p in env.prey:
+        p.x, p.y = random.uniform(0, w), random.uniform(0, h)
+    env.rebuild_index()
+    return env
+
+
+def run_benchmarks(sizes: list, steps: int, repeats: int, seed: int = 0) -> dict:
+    results = {}
+    quiet = io.StringIO()
+
+    for n in sizes:
+        config = bench_config(n, steps)
+        env = make_env(config, seed)
+        sample = env.agents[:1000]
+        print(f"N={n}: listeners, get_state, evolution, clustering, generation")
+
+        # Listeners scan the grid on every call, so each repeat times a real query
+        results[f"collision_listener@{n}"] = timed(lambda: [env.collisionListener(a) for a in sample], repeats)
+        results[f"sight_listener@{n}"] = timed(lambda: [env.sightListener(a) for a in sample], repeats)
+        results[f"get_state@{n}"] = timed(
+            lambda: [pr.rl_agent.get_state(pr, env.prey) for pr in env.predators], repeats)
+
+        def indexed_states():
+            env.epoch += 1  # force the nearest-prey index to be rebuilt, as once per tick
+            return [pr.rl_agent.state_for(pr, env.nearest_prey(pr)) for pr in env.predators]
+
+        results[f"get_state_indexed@{n}"] = timed(indexed_states, repeats)
+        results[f"evolve_prey@{n}"] = timed(lambda: evolve_prey(env.prey, config), repeats)
+        results[f"cluster_prey_traits@{n}"] = timed(lambda: cluster_prey_traits(env.prey, config["k_clusters"]), repeats)
+
+        def agents_generation():
+            gen_env = make_env(config, seed)
+            with contextlib.redirect_stdout(quiet):
+                run_generation(gen_env, 0, config)
+                next_generation(gen_env, config)
+
+        def vectorized_generation():
+            random.seed(seed)
+            rng = np.random.default_rng(seed)
+            world = build_world(config, rng, SimClock(config["tick_ms"]))
+            world.last_states = encode_states(world)
+            world.last_actions = [random.choice(learner.actions) for learner in world.learners]
+            for _ in range(steps):
+                step_world(world, world.clock.get_ticks(), rng)
+                world.clock.tick()
+
+        results[f"generation_agents@{n}"] = timed(agents_generation, 1)
+        results[f"generation_vectorized@{n}"] = timed(vectorized_generation, 1)
+        quiet.seek(0)
+        quiet.truncate()
+
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """Names whose min time grew by more than `threshold` relative to the baseline."""
+    regressions = []
+    for name, stats in results.items():
+        base = baseline.get(name)
+        if base and stats["min_ms"] > base["min_ms"] * (1 + threshold):
+            regressions.append((name, base["min_ms"], stats["min_ms"]))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the simulation core at several population sizes.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--steps", type=int, default=50, help="ticks in the full-generation benchmark")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--out", default="data/bench/latest.json")
+    parser.add_argument("--baseline", default="data/bench/baseline.json")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown before flagging, e.g. 0.25 = 25%%")
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.sizes, args.steps, args.repeats)
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "sizes": args.sizes,
+            "steps": args.steps,
+        },
+        "results": results,
+    }
+
+    os.makedirs(os.path.dirname(args.out) or ".", exist_ok=True)
+    with open(args.out, "w") as f:
+        json.dump(report, f, indent=2)
+    for name, stats in results.items():
+        print(f"{name:34s} {stats['min_ms']:10.3f} ms")
+    print(f"Results saved to {args.out}")
+
+    if args.update_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline updated: {args.baseline}")
+        return
+
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        for name, before, after in regressions:
+            print(f"REGRESSION {name}: {before:.3f} ms -> {after:.3f} ms")
+        if regressions:
+            sys.exit(1)
+        print("No regressions against baseline.")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,12 +3,29 @@ CONFIG = {
     "num_generations": 8,
     "num_prey": 20,
     "num_predators": 5,
+    "seed": None,  # seed for the random module; None for a fresh run every time
     "world_size": (1200, 800),
     "white": (255, 255, 255),
     "blue": (0, 100, 255),
     "red": (255, 0, 0),
     "transparent": (255, 255, 255, 0),
-    "time_steps_per_generation": 300,
+    "time_steps_per_generation": 300,  # upper bound; "termination" can end a generation sooner
+    # Early end of a generation; logs record the ticks actually run and why it ended
+    "termination": {
+        "all_prey_dead": True,
+        "stall_ticks": 0,  # end after N ticks without a capture (0 = off)
+        "plateau_window": 0,  # end once fewer than plateau_tolerance of the live prey
+        "plateau_tolerance": 0.01,  # were caught over the last plateau_window ticks (0 = off)
+    },
+    "engine": "agents",  # "agents" (one object per agent) or "vectorized" (NumPy arrays)
+    "headless": False,  # run without pygame, using a simulated clock
+    "tick_ms": 1000 / 60,  # simulated milliseconds per tick
+    "target_fps": 60,  # frames drawn per second by the interactive view
+    "frame_budget_ms": None,  # max time per frame for rendering plus ticks; None = 1000 / target_fps
+    "sim_process": False,  # run the engine in its own process; the window draws shared-memory snapshots
+    "simulation_speed": 1.0,  # ticks per frame multiplier; float("inf") runs flat out, rendering at target_fps
+    "compact_threshold": 0.25,  # dead share of agent slots that triggers a list rebuild mid-generation
+    "profile": False,  # time each phase of the step loop and add a breakdown to the logs
 
     # Prey trait ranges
     "trait_range": {
@@ -24,12 +41,24 @@ CONFIG = {
     # Genetic Algorithm settings
     "mutation_rate": 0.05,
     "crossover_rate": 0.6,
+    "selection": "roulette",  # "roulette" or "tournament"
+    "tournament_size": 3,
 
     # Reinforcement Learning settings
     "rl": {
         "learning_rate": 0.2,
         "discount_factor": 0.9,
         "epsilon": 0.4,
+        "learner": "dict",  # "dict" (string-keyed states), "array" (dense NumPy table) or "linear" (features, fixed memory)
+        "shared": False,  # one learner for all predators, updated in a batch per tick
+    },
+
+    # Island model (python -m logic.islands)
+    "islands": {
+        "count": 4,
+        "migration_interval": 5,  # generations between migrations
+        "migrants": 2,  # top genomes sent along each topology edge
+        "topology": "ring",  # "ring", "fully_connected" or "random"
     },
 
     # Clustering settings
@@ -38,5 +67,10 @@ CONFIG = {
 
     # Output
     "log_dir": "data/logs",
+    "async_plots": True,  # draw plots in a background process instead of blocking the loop
+    "plot_queue_size": 8,  # plots allowed to queue up before a generation boundary waits
+    "checkpoint_interval": 0,  # save the full simulation state every N generations (0 = off)
+    "checkpoint_dir": "data/checkpoints",
+    "log_format": "json",  # "json" (gen_N.json per generation) or "columnar" (append-only binary run log)
     "plot_dir": "data/plots",
 }
@@ -1,19 +1,24 @@
-import pygame
 import random
 from typing import List
 
 class BaseAgent:
+    __slots__ = ("x", "y", "config", "environment", "entity_class", "color_key", "radius",
+                 "vision", "speed", "alive", "total_reward", "fitness", "vel_x", "vel_y")
+
     def __init__(self, x: float, y: float, config: dict, environment, entity_class: str, color_key: str):
-        self.x = x
-        self.y = y
         self.config = config
         self.environment = environment
         self.entity_class = entity_class
         self.color_key = color_key
-
         self.radius = 8
-        self.vision = random.uniform(*config["trait_range"]["vision"])
-        self.speed = random.uniform(*config["trait_range"]["speed"])
+        self.respawn(x, y)
+
+    def respawn(self, x: float, y: float):
+        """Reset everything that belongs to one life, so a pooled agent can be reused."""
+        self.x = x
+        self.y = y
+        self.vision = random.uniform(*self.config["trait_range"]["vision"])
+        self.speed = random.uniform(*self.config["trait_range"]["speed"])
 
         self.alive = True
         self.total_reward = 0.0
@@ -23,6 +28,7 @@ class BaseAgent:
         self.vel_y = 0.0
 
     def update(self):
+        old_x, old_y = self.x, self.y
         self.x += self.vel_x
         self.y += self.vel_y
 
@@ -37,10 +43,13 @@ class BaseAgent:
         elif self.y > h - self.radius:
             self.y = h - self.radius
 
-        self.collisionDetector()
-        self.visionDetector()
+        # Neighbour caches only need invalidating when something actually moved
+        if self.x != old_x or self.y != old_y:
+            self.environment.move_agent(self)
 
     def handle_input(self, keys):
+        import pygame
+
         self.vel_x = 0.0
         self.vel_y = 0.0
 
@@ -81,11 +90,12 @@ class BaseAgent:
         return self.environment.sightListener(self)
 
     def draw(self, surface):
-        vision_radius_px = int(self.vision * self.radius)
-        temp_surf = pygame.Surface((vision_radius_px * 2, vision_radius_px * 2), pygame.SRCALPHA)
+        import pygame
+        from ui.sprite_cache import sprites
 
         semi_transparent = (*self.config[self.color_key], 50)  # (R, G, B, alpha)
-        pygame.draw.circle(temp_surf, semi_transparent, (vision_radius_px, vision_radius_px), vision_radius_px)
+        vision_radius_px = sprites.quantize(self.vision * self.radius)
+        temp_surf = sprites.circle(vision_radius_px, semi_transparent)
 
         surface.blit(temp_surf, (int(self.x - vision_radius_px), int(self.y - vision_radius_px)))
 
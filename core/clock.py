@@ -0,0 +1,23 @@
+class SimClock:
+    """Simulated millisecond clock that advances a fixed amount per tick."""
+
+    def __init__(self, tick_ms: float = 1000 / 60):
+        self.tick_ms = tick_ms
+        self.ticks = 0
+
+    def get_ticks(self) -> int:
+        return int(self.ticks * self.tick_ms)
+
+    def tick(self):
+        self.ticks += 1
+
+
+class WallClock:
+    """Milliseconds since pygame.init(), used by the interactive view."""
+
+    def get_ticks(self) -> int:
+        import pygame
+        return pygame.time.get_ticks()
+
+    def tick(self):
+        pass
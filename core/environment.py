@@ -1,51 +1,177 @@
+import math
 import random
-from typing import List
+from typing import List, Tuple
 from core.agent_base import BaseAgent
+from core.spatial import SpatialGrid
+from core.registry import AgentRegistry
+from core.pool import AgentPool
+from core.clock import WallClock
+from analysis.profiler import NullProfiler
+from analysis.plot_worker import InlinePlotter
 
 class Environment:
-    def __init__(self, config: dict):
+    def __init__(self, config: dict, clock=None):
         self.config = config
-        self.agents: List[BaseAgent] = []
-        self.prey: List[BaseAgent] = []
-        self.predators: List[BaseAgent] = []
+        self.clock = clock if clock is not None else WallClock()
+        self.registry = AgentRegistry(config.get("compact_threshold", 0.25))
+        # Killed agents wait here to be respawned by the next generation's refill
+        self.pool = AgentPool()
+        self.shared_learner = None
+        self.generation_stats = {}
+        self.profiler = NullProfiler()
+        self.plotter = InlinePlotter()
+
+        # Spatial index shared by collision and vision queries
+        self.grid = SpatialGrid(64)
+        self.max_radius = 0.0
+
+        # Bumped whenever anything moves or the agent set changes; nearest-prey
+        # answers are cached for one epoch
+        self.epoch = 0
+        self._nearest_prey = {}
+        self._nearest_epoch = -1
+
+    def __getstate__(self):
+        # Profiler and plotter belong to the running process, not to the world
+        state = self.__dict__.copy()
+        state["profiler"] = NullProfiler()
+        state["plotter"] = InlinePlotter()
+        state["_nearest_prey"] = {}
+        state["_nearest_epoch"] = -1
+        return state
+
+    @property
+    def agents(self) -> List[BaseAgent]:
+        return self.registry.agents
+
+    @property
+    def prey(self) -> List[BaseAgent]:
+        return self.registry.prey
+
+    @property
+    def predators(self) -> List[BaseAgent]:
+        return self.registry.predators
 
     def add_agent(self, agent: BaseAgent):
-        self.agents.append(agent)
-        if agent.entity_class == "prey":
-            self.prey.append(agent)
-        elif agent.entity_class == "predator":
-            self.predators.append(agent)
+        self.registry.add(agent)
+        self.max_radius = max(self.max_radius, agent.radius)
+        self.grid.insert(agent)
+        self.epoch += 1
+
+    def move_agent(self, agent: BaseAgent):
+        self.grid.move(agent)
+        self.epoch += 1
+
+    def set_agents(self, agents: List[BaseAgent]):
+        """Replace the population and re-index it."""
+        self.registry.reset(agents)
+        self.rebuild_index()
+
+    def rebuild_index(self):
+        """Re-index `self.agents`, sizing grid cells from the largest vision radius."""
+        self.max_radius = max((a.radius for a in self.agents), default=0.0)
+        cell_size = max((a.vision * a.radius for a in self.agents), default=64)
+        self.grid = SpatialGrid(cell_size)
+        for agent in self.agents:
+            if agent.alive:
+                self.grid.insert(agent)
+        self.epoch += 1
 
     def reset_generation(self):
+        self.compact()
         for p in self.prey:
             p.alive = True
+        self.epoch += 1
 
-    def collisionListener(self, agent: BaseAgent) -> List[BaseAgent]:
-        collisions = []
-        for other in self.agents:
-            if other is agent or other.entity_class == agent.entity_class:
+    def _nearby(self, agent: BaseAgent, reach: float):
+        # Small margin so float rounding at cell edges never drops a candidate
+        return self.grid.query(agent.x, agent.y, reach + self.max_radius + 1.0)
+
+    def neighbours(self, agent: BaseAgent, kind: str = "sight") -> List[Tuple[BaseAgent, float]]:
+        """(other, distance) pairs touching (``"collision"``) or seen by (``"sight"``) `agent`.
+
+        Distances come with the pairs so callers pick the closest without
+        measuring again. Agents move one at a time, so every query scans the
+        grid as it is now rather than sharing a per-tick snapshot.
+        """
+        collision = kind == "collision"
+        reach = agent.radius if collision else agent.vision * agent.radius
+        pairs = []
+        for other in self._nearby(agent, reach):
+            if other is agent or (collision and other.entity_class == agent.entity_class):
                 continue
-            dx = agent.x - other.x
-            dy = agent.y - other.y
-            dist = (dx*dx + dy*dy) ** 0.5
-            if dist < agent.radius + other.radius:
-                collisions.append(other)
-        return collisions
+            dist = math.hypot(agent.x - other.x, agent.y - other.y)
+            if dist < reach + other.radius:
+                pairs.append((other, dist))
+        slot = self.registry.slot
+        pairs.sort(key=lambda pair: slot[pair[0]])
+        return pairs
 
-    def sightListener(self, agent: BaseAgent) -> List[BaseAgent]:
-        visible = []
-        for other in self.agents:
-            if other is agent:
+    def nearest_prey(self, agent: BaseAgent):
+        """Closest live prey to `agent`, or None.
+
+        Answers come from a ring search of the spatial grid, which is already
+        kept up to date as agents move. Every predator's answer is computed in
+        one batch the first time one is needed after something moved; an
+        answer whose prey has since been caught is looked up again.
+        """
+        if self._nearest_epoch != self.epoch:
+            self._nearest_prey = {pr: self._find_nearest_prey(pr.x, pr.y) for pr in self.predators}
+            self._nearest_epoch = self.epoch
+        prey = self._nearest_prey.get(agent)
+        if prey is None or not prey.alive:
+            prey = self._find_nearest_prey(agent.x, agent.y)
+        return prey
+
+    def _find_nearest_prey(self, x: float, y: float):
+        # Give up on the grid once it would visit more cells than a plain scan touches prey
+        settled, prey = self.grid.nearest(x, y, _is_live_prey, self.registry.slot.__getitem__, len(self.prey) + 9)
+        if settled:
+            return prey
+        best, best_dist = None, float("inf")
+        for p in self.prey:
+            if not p.alive:
                 continue
-            dx = agent.x - other.x
-            dy = agent.y - other.y
+            dx = p.x - x
+            dy = p.y - y
             dist = (dx*dx + dy*dy) ** 0.5
-            if dist < agent.vision * agent.radius + other.radius:
-                visible.append(other)
-        return visible
+            if dist < best_dist:
+                best, best_dist = p, dist
+        return best
+
+    def collisionListener(self, agent: BaseAgent) -> List[BaseAgent]:
+        return [other for other, _ in self.neighbours(agent, "collision")]
+
+    def sightListener(self, agent: BaseAgent) -> List[BaseAgent]:
+        return [other for other, _ in self.neighbours(agent, "sight")]
+
+    def count_alive_prey(self) -> int:
+        # Only prey are ever killed, so every dead slot is a prey
+        return len(self.prey) - self.registry.dead
+
+    def kill(self, agent: BaseAgent):
+        """Mark `agent` dead; it leaves the spatial index at the end of the tick."""
+        self.registry.kill(agent)
 
     def remove_dead_agents(self):
-        alive_agents = [a for a in self.agents if a.alive]
-        self.agents = alive_agents
-        self.prey = [p for p in self.prey if p.alive]
-        self.predators = [pr for pr in self.predators if pr.alive]
+        """Take this tick's kills out of the spatial index; free when nobody died."""
+        removed = self.registry.flush()
+        if not removed:
+            return
+        for agent in removed:
+            self.grid.remove(agent)
+        self.pool.release(removed)
+        self.epoch += 1
+
+    def compact(self):
+        """Drop dead agents from `agents`/`prey`/`predators` right away."""
+        for agent in self.registry.pending:
+            self.grid.remove(agent)
+        self.pool.release(self.registry.pending)
+        self.registry.pending = []
+        self.registry.compact()
+        self.epoch += 1
+
+
+def _is_live_prey(agent) -> bool:
+    return agent.alive and agent.entity_class == "prey"
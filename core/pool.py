@@ -0,0 +1,27 @@
+from typing import Dict, Iterable, List
+
+
+class AgentPool:
+    """Dead agents kept for reuse instead of allocating new ones.
+
+    Agents are pooled per `entity_class`; `acquire` hands one back (the caller
+    resets it with `respawn`) or returns None when the pool is empty. At most
+    `max_size` agents of each class are kept.
+    """
+
+    def __init__(self, max_size: int = 100_000):
+        self.max_size = max_size
+        self.free: Dict[str, List] = {}
+
+    def __len__(self):
+        return sum(len(agents) for agents in self.free.values())
+
+    def release(self, agents: Iterable):
+        for agent in agents:
+            free = self.free.setdefault(agent.entity_class, [])
+            if len(free) < self.max_size:
+                free.append(agent)
+
+    def acquire(self, entity_class: str):
+        free = self.free.get(entity_class)
+        return free.pop() if free else None
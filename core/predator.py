@@ -1,20 +1,16 @@
-import math, pygame
+import math
 from core.agent_base import BaseAgent
-from logic.rl import QLearningAgent
+from logic.rl import ACTIONS, build_q_agent
 
 class Predator(BaseAgent):
-    def __init__(self, x: float, y: float, config: dict, environment):
+    __slots__ = ("last_random_time", "random_target", "idle_until", "rl_agent", "last_state", "last_action")
+
+    def __init__(self, x: float, y: float, config: dict, environment, rl_agent=None):
         super().__init__(x, y, config, environment, entity_class="predator", color_key="red")
-        self.last_random_time = pygame.time.get_ticks()
+        self.last_random_time = environment.clock.get_ticks()
         self.random_target = (x, y)
         self.idle_until = 0
-        actions = ["up", "down", "left", "right", "stay"]
-        rl_cfg = config["rl"]
-        self.rl_agent = QLearningAgent(actions,
-                                       rl_cfg["learning_rate"],
-                                       rl_cfg["discount_factor"],
-                                       rl_cfg["epsilon"],
-                                       config)
+        self.rl_agent = rl_agent if rl_agent is not None else build_q_agent(ACTIONS, config)
         self.total_reward = 0.0
         self.last_state = None
         self.last_action = None
@@ -22,7 +18,7 @@ class Predator(BaseAgent):
         self.vision = config.get("predator_vision", 20.0)
 
     def decide_action(self):
-        state = self.rl_agent.get_state(self, self.environment.prey)
+        state = self.rl_agent.state_for(self, self.environment.nearest_prey(self))
         action = self.rl_agent.choose_action(state)
         self.last_state = state
         self.last_action = action
@@ -44,20 +40,16 @@ class Predator(BaseAgent):
     def handle_movement(self):
         # See which prey are in vision
         visible_prey = [
-            agent for agent in self.visionDetector()
+            (agent, dist) for agent, dist in self.environment.neighbours(self)
             if agent.entity_class == "prey" and agent.alive
         ]
 
         if visible_prey:
             # --- CHASE MODE ---
             # Find the closest prey
-            target = min(
-                visible_prey,
-                key=lambda p: math.hypot(self.x - p.x, self.y - p.y)
-            )
+            target, distance = min(visible_prey, key=lambda pair: pair[1])
             dx = target.x - self.x
             dy = target.y - self.y
-            distance = math.hypot(dx, dy)
             if distance > 0:
                 dx /= distance
                 dy /= distance
@@ -78,12 +70,12 @@ class Predator(BaseAgent):
 
         if dist < epsilon:
             self.random_target = self.random_pos()
-            self.idle_until = pygame.time.get_ticks() + 2000  # idle for 2 seconds
+            self.idle_until = self.environment.clock.get_ticks() + 2000  # idle for 2 seconds
             self.vel_x = 0
             self.vel_y = 0
             return
 
-        if pygame.time.get_ticks() < self.idle_until:
+        if self.environment.clock.get_ticks() < self.idle_until:
             self.vel_x = 0
             self.vel_y = 0
             return
@@ -99,12 +91,12 @@ class Predator(BaseAgent):
             print(f"Predator at ({self.x:.1f},{self.y:.1f}) collided with {[ (p.x,p.y) for p in collided ]}")
             for p in collided:
                 if p.entity_class == "prey" and p.alive:
-                    p.alive = False
+                    self.environment.kill(p)
                     reward += 5.0
 
         reward -= 0.001
 
-        next_state = self.rl_agent.get_state(self, self.environment.prey)
+        next_state = self.rl_agent.state_for(self, self.environment.nearest_prey(self))
 
         if self.last_state is not None and self.last_action is not None:
             self.rl_agent.update_q(self.last_state, self.last_action, reward, next_state)
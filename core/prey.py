@@ -1,14 +1,18 @@
-import math, pygame
+import math
 import random
 from core.agent_base import BaseAgent
 
 class Prey(BaseAgent):
+    __slots__ = ("last_random_time", "random_target", "idle_until", "traits")
+
     def __init__(self, x: float, y: float, config: dict, environment):
         super().__init__(x, y, config, environment, entity_class="prey", color_key="blue")
-        self.last_random_time = pygame.time.get_ticks()
+
+    def respawn(self, x: float, y: float):
+        super().respawn(x, y)
+        self.last_random_time = self.environment.clock.get_ticks()
         self.random_target = (x, y)
         self.idle_until = 0
-        self.fitness = 0.0
 
     def update(self):
         if self.alive:
@@ -17,22 +21,18 @@ class Prey(BaseAgent):
 
     def handle_movement(self):
         visible_predators = [
-            agent for agent in self.visionDetector()
+            (agent, dist) for agent, dist in self.environment.neighbours(self)
             if agent.entity_class == "predator" and agent.alive
         ]
-        now = pygame.time.get_ticks()
+        now = self.environment.clock.get_ticks()
         epsilon = 5
 
         if visible_predators:
             # --- ESCAPE MODE ---
             # Run directly away from the closest predator
-            closest_pred = min(
-                visible_predators,
-                key=lambda p: math.hypot(self.x - p.x, self.y - p.y)
-            )
+            closest_pred, distance = min(visible_predators, key=lambda pair: pair[1])
             dx = self.x - closest_pred.x
             dy = self.y - closest_pred.y
-            distance = math.hypot(dx, dy)
             if distance > 0:
                 dx /= distance
                 dy /= distance
@@ -57,7 +57,7 @@ class Prey(BaseAgent):
             self.vel_y = 0
             return
 
-        if pygame.time.get_ticks() < self.idle_until:
+        if now < self.idle_until:
             # still idling
             self.vel_x = 0
             self.vel_y = 0
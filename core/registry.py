@@ -0,0 +1,77 @@
+from typing import Callable, List
+
+
+class AgentRegistry:
+    """Agents in stable slots, removed lazily.
+
+    `kill` only marks an agent and queues it; `flush` hands the queued agents
+    to the removal listeners and leaves them in place. The lists are rebuilt
+    (keeping order) only once dead agents make up more than
+    `compact_threshold` of all slots, so a tick without captures costs
+    nothing. Until then `agents`, `prey` and `predators` may still hold dead
+    agents; callers filter on ``agent.alive``.
+    """
+
+    def __init__(self, compact_threshold: float = 0.25):
+        self.compact_threshold = compact_threshold
+        self.agents: List = []
+        self.prey: List = []
+        self.predators: List = []
+        self.slot = {}
+        self.dead = 0
+        self.pending: List = []
+        self.listeners: List[Callable] = []
+
+    def __getstate__(self):
+        # Listeners belong to whoever subscribed in this process
+        state = self.__dict__.copy()
+        state["listeners"] = []
+        return state
+
+    def on_remove(self, callback: Callable):
+        """Call `callback(removed_agents)` whenever dead agents are flushed."""
+        self.listeners.append(callback)
+
+    def add(self, agent):
+        self.slot[agent] = len(self.agents)
+        self.agents.append(agent)
+        if agent.entity_class == "prey":
+            self.prey.append(agent)
+        elif agent.entity_class == "predator":
+            self.predators.append(agent)
+
+    def reset(self, agents: list):
+        """Replace the whole population, e.g. at a generation boundary."""
+        self.agents, self.prey, self.predators = [], [], []
+        self.slot = {}
+        self.dead = 0
+        self.pending = []
+        for agent in agents:
+            self.add(agent)
+
+    def kill(self, agent) -> bool:
+        if not agent.alive:
+            return False
+        agent.alive = False
+        self.pending.append(agent)
+        return True
+
+    def flush(self) -> list:
+        """Remove the agents killed since the last flush and return them."""
+        if not self.pending:
+            return []
+        removed, self.pending = self.pending, []
+        self.dead += len(removed)
+        for callback in self.listeners:
+            callback(removed)
+        if self.dead > self.compact_threshold * len(self.agents):
+            self.compact()
+        return removed
+
+    def compact(self):
+        """Drop dead agents from the lists, keeping the order of the living."""
+        self.agents = [a for a in self.agents if a.alive]
+        self.prey = [p for p in self.prey if p.alive]
+        self.predators = [pr for pr in self.predators if pr.alive]
+        self.slot = {agent: i for i, agent in enumerate(self.agents)}
+        self.dead = 0
@@ -0,0 +1,97 @@
+from typing import Dict, Iterator, Set, Tuple
+
+
+class SpatialGrid:
+    """Uniform bucket grid used by the Environment to answer range queries."""
+
+    def __init__(self, cell_size: float):
+        self.cell_size = max(1.0, float(cell_size))
+        self.cells: Dict[Tuple[int, int], Set] = {}
+        self.cell_of: Dict[object, Tuple[int, int]] = {}
+
+    def _key(self, x: float, y: float) -> Tuple[int, int]:
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+    def clear(self):
+        self.cells.clear()
+        self.cell_of.clear()
+
+    def insert(self, agent):
+        key = self._key(agent.x, agent.y)
+        bucket = self.cells.get(key)
+        if bucket is None:
+            bucket = self.cells[key] = set()
+        bucket.add(agent)
+        self.cell_of[agent] = key
+
+    def remove(self, agent):
+        key = self.cell_of.pop(agent, None)
+        if key is None:
+            return
+        bucket = self.cells[key]
+        bucket.discard(agent)
+        if not bucket:
+            del self.cells[key]
+
+    def move(self, agent):
+        old_key = self.cell_of.get(agent)
+        if old_key is None:
+            return
+        if old_key != self._key(agent.x, agent.y):
+            self.remove(agent)
+            self.insert(agent)
+
+    def nearest(self, x: float, y: float, accept, rank, max_cells: int):
+        """Closest accepted agent to (x, y) by searching rings of cells outward.
+
+        Ties go to the lowest ``rank(agent)``. Returns ``(True, agent)`` (agent
+        may be None), or ``(False, None)`` if the answer was not settled
+        within `max_cells` cells, so the caller can fall back to a scan.
+        """
+        size = self.cell_size
+        col, row = int(x // size), int(y // size)
+        cells = self.cells
+        best, best_dist, best_rank = None, float("inf"), None
+        visited = 0
+        ring = 0
+        while True:
+            for key in _ring(col, row, ring):
+                visited += 1
+                for agent in cells.get(key, ()):
+                    if not accept(agent):
+                        continue
+                    dx = agent.x - x
+                    dy = agent.y - y
+                    dist = (dx*dx + dy*dy) ** 0.5
+                    if dist < best_dist or (dist == best_dist and rank(agent) < best_rank):
+                        best, best_dist, best_rank = agent, dist, rank(agent)
+            # Everything beyond this ring is at least ring * size away
+            if best_dist < ring * size:
+                return True, best
+            if visited >= max_cells:
+                return False, None
+            ring += 1
+
+    def query(self, x: float, y: float, reach: float) -> Iterator:
+        """Yield every agent whose cell overlaps the square of half-size `reach`."""
+        size = self.cell_size
+        col_min, col_max = int((x - reach) // size), int((x + reach) // size)
+        row_min, row_max = int((y - reach) // size), int((y + reach) // size)
+        cells = self.cells
+        for col in range(col_min, col_max + 1):
+            for row in range(row_min, row_max + 1):
+                bucket = cells.get((col, row))
+                if bucket:
+                    yield from bucket
+
+
+def _ring(col: int, row: int, ring: int) -> Iterator[Tuple[int, int]]:
+    if ring == 0:
+        yield col, row
+        return
+    for c in range(col - ring, col + ring + 1):
+        yield c, row - ring
+        yield c, row + ring
+    for r in range(row - ring + 1, row + ring):
+        yield col - ring, r
+        yield col + ring, r
@@ -0,0 +1,165 @@
+import numpy as np
+from typing import List
+from analysis.profiler import NullProfiler
+from analysis.plot_worker import InlinePlotter
+
+TRAIT_NAMES = ("speed", "agility", "vision")
+AGENT_RADIUS = 8
+
+
+class WorldState:
+    """Struct-of-arrays storage for one world.
+
+    Prey occupy rows ``[0, n_prey)`` and predators the rows after them, so
+    every per-agent quantity lives in one contiguous array.
+    """
+
+    def __init__(self, n_prey: int, n_predators: int):
+        n = n_prey + n_predators
+        self.n_prey = n_prey
+        self.n_predators = n_predators
+
+        self.x = np.zeros(n, np.float32)
+        self.y = np.zeros(n, np.float32)
+        self.vel_x = np.zeros(n, np.float32)
+        self.vel_y = np.zeros(n, np.float32)
+        self.radius = np.full(n, AGENT_RADIUS, np.float32)
+        self.vision = np.zeros(n, np.float32)
+        self.speed = np.zeros(n, np.float32)
+        self.alive = np.ones(n, bool)
+        self.fitness = np.zeros(n, np.float32)
+        # Rewards accumulate small per-tick penalties, keep full precision
+        self.total_reward = np.zeros(n, np.float64)
+
+        # Wander state
+        self.target_x = np.zeros(n, np.float32)
+        self.target_y = np.zeros(n, np.float32)
+        self.idle_until = np.zeros(n, np.float64)
+
+        self.traits = np.zeros((n_prey, len(TRAIT_NAMES)), np.float32)
+
+    @property
+    def prey(self) -> slice:
+        return slice(0, self.n_prey)
+
+    @property
+    def predators(self) -> slice:
+        return slice(self.n_prey, self.n_prey + self.n_predators)
+
+
+def _column(name, cast=float):
+    def getter(self):
+        return cast(getattr(self.state, name)[self.index])
+
+    def setter(self, value):
+        getattr(self.state, name)[self.index] = value
+
+    return property(getter, setter)
+
+
+class AgentView:
+    """Agent-like view over one row of a WorldState, used by the UI and loggers."""
+
+    __slots__ = ("state", "index")
+    entity_class = None
+
+    def __init__(self, state: WorldState, index: int):
+        self.state = state
+        self.index = index
+
+    x = _column("x")
+    y = _column("y")
+    vel_x = _column("vel_x")
+    vel_y = _column("vel_y")
+    radius = _column("radius", int)
+    vision = _column("vision")
+    speed = _column("speed")
+    alive = _column("alive", bool)
+    fitness = _column("fitness")
+    total_reward = _column("total_reward")
+
+
+class PreyView(AgentView):
+    __slots__ = ()
+    entity_class = "prey"
+
+    @property
+    def traits(self) -> dict:
+        row = self.state.traits[self.index]
+        return {name: float(row[i]) for i, name in enumerate(TRAIT_NAMES)}
+
+    @traits.setter
+    def traits(self, values: dict):
+        row = self.state.traits[self.index]
+        for i, name in enumerate(TRAIT_NAMES):
+            row[i] = values[name]
+
+
+class PredatorView(AgentView):
+    __slots__ = ("rl_agent",)
+    entity_class = "predator"
+
+    def __init__(self, state: WorldState, index: int, rl_agent=None):
+        super().__init__(state, index)
+        self.rl_agent = rl_agent
+
+
+class VectorEnvironment:
+    """Environment-compatible wrapper around a WorldState.
+
+    Exposes ``agents``/``prey``/``predators`` as lists of views so code written
+    against `Environment` (renderer, loggers, clustering) keeps working.
+    """
+
+    def __init__(self, config: dict, state: WorldState, learners: list, clock):
+        self.config = config
+        self.clock = clock
+        self.learners = learners
+        self.shared_learner = None
+        self.generation_stats = {}
+        self.profiler = NullProfiler()
+        self.plotter = InlinePlotter()
+        self.set_state(state)
+
+    def __getstate__(self):
+        # Profiler and plotter belong to the running process, not to the world
+        state = self.__dict__.copy()
+        state["profiler"] = NullProfiler()
+        state["plotter"] = InlinePlotter()
+        return state
+
+    def set_state(self, state: WorldState):
+        self.state = state
+        self._prey_views = [PreyView(state, i) for i in range(state.n_prey)]
+        self._predator_views = [
+            PredatorView(state, state.n_prey + i, learner)
+            for i, learner in enumerate(self.learners)
+        ]
+
+    @property
+    def prey(self) -> List[PreyView]:
+        alive = self.state.alive[self.state.prey]
+        return [self._prey_views[i] for i in np.flatnonzero(alive)]
+
+    @property
+    def predators(self) -> List[PredatorView]:
+        return list(self._predator_views)
+
+    @property
+    def agents(self) -> List[AgentView]:
+        return self.prey + self.predators
+
+    def count_alive_prey(self) -> int:
+        return int(self.state.alive[self.state.prey].sum())
+
+    def prey_columns(self) -> dict:
+        """Trait, fitness and alive columns of the live prey, straight from the arrays."""
+        state = self.state
+        live = np.flatnonzero(state.alive[state.prey])
+        columns = {name: state.traits[live, i] for i, name in enumerate(TRAIT_NAMES)}
+        columns["fitness"] = state.fitness[live]
+        columns["alive"] = state.alive[live]
+        return columns
+
+    def reset_generation(self):
+        self.state.alive[self.state.prey] = True
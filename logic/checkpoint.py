@@ -0,0 +1,57 @@
+import os
+import pickle
+import random
+import zlib
+
+MAGIC = b"EVCK"
+VERSION = 1
+
+
+def save_checkpoint(path: str, env, generation: int, rng=None):
+    """Write the whole simulation state needed to continue from `generation`.
+
+    The environment (agents, genomes, Q-tables, spatial index, clock and
+    clusterer) is pickled together with the `random` module state and, for
+    the vectorized engine, its NumPy generator, then zlib-compressed.
+    """
+    payload = {
+        "version": VERSION,
+        "generation": generation,
+        "env": env,
+        "random_state": random.getstate(),
+        "rng": rng,
+    }
+    data = zlib.compress(pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL))
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path + ".tmp", "wb") as f:
+        f.write(MAGIC + data)
+    os.replace(path + ".tmp", path)
+
+
+def load_checkpoint(path: str) -> dict:
+    with open(path, "rb") as f:
+        data = f.read()
+    if not data.startswith(MAGIC):
+        raise ValueError(f"{path} is not a simulation checkpoint")
+    payload = pickle.loads(zlib.decompress(data[len(MAGIC):]))
+    if payload["version"] != VERSION:
+        raise ValueError(f"Unsupported checkpoint version {payload['version']}")
+    return payload
+
+
+def resume_state(path: str, config: dict) -> dict:
+    """Load a checkpoint and restore the global RNG so the run continues exactly."""
+    payload = load_checkpoint(path)
+    random.setstate(payload["random_state"])
+    # Agents share env.config; bring it in line with the config being run
+    payload["env"].config.update(config)
+    return payload
+
+
+def maybe_checkpoint(env, gen: int, config: dict, rng=None):
+    """Save a checkpoint after generation `gen` if it falls on `checkpoint_interval`."""
+    interval = config.get("checkpoint_interval", 0)
+    if interval and (gen + 1) % interval == 0:
+        path = os.path.join(config.get("checkpoint_dir", "data/checkpoints"), f"gen_{gen+1}.ckpt")
+        save_checkpoint(path, env, gen + 1, rng)
+        print(f"Checkpoint saved: {path}")
@@ -1,48 +1,74 @@
 import random
-import copy
+import numpy as np
+from core.world_state import TRAIT_NAMES
+
+def genome_matrix(prey_list: list) -> np.ndarray:
+    """Stack prey traits into an N x len(TRAIT_NAMES) array."""
+    rows = [[p.traits[t] for t in TRAIT_NAMES] for p in prey_list]
+    return np.array(rows, dtype=float).reshape(-1, len(TRAIT_NAMES))
+
+def random_genomes(config: dict, rng, n: int) -> np.ndarray:
+    lows = [config["trait_range"][t][0] for t in TRAIT_NAMES]
+    highs = [config["trait_range"][t][1] for t in TRAIT_NAMES]
+    return rng.uniform(lows, highs, size=(n, len(TRAIT_NAMES)))
+
+def select_parents(fitness: np.ndarray, n: int, config: dict, rng) -> np.ndarray:
+    """Pick 2 x n parent indices, by roulette wheel or tournament."""
+    if config.get("selection", "roulette") == "tournament":
+        size = config.get("tournament_size", 3)
+        entrants = rng.integers(0, len(fitness), size=(2, n, size))
+        winners = fitness[entrants].argmax(axis=2)
+        return np.take_along_axis(entrants, winners[..., None], axis=2)[..., 0]
+
+    cumulative = np.cumsum(fitness)
+    picks = rng.uniform(0, cumulative[-1], size=(2, n))
+    return np.minimum(np.searchsorted(cumulative, picks), len(fitness) - 1)
+
+def evolve_genomes(genomes: np.ndarray, fitness: np.ndarray, n: int, config: dict, rng):
+    """Breed n child genomes from the parents' genome matrix.
+
+    Returns the children and, for each child, the index of its first parent.
+    """
+    if n == 0 or len(genomes) == 0:
+        return np.zeros((0, len(TRAIT_NAMES))), np.zeros(0, dtype=int)
+
+    fitness = np.asarray(fitness, dtype=float)
+    if fitness.sum() == 0:
+        fitness = np.ones(len(genomes))
+
+    parent1, parent2 = select_parents(fitness, n, config, rng)
+    children = (genomes[parent1] + genomes[parent2]) / 2
+
+    mutate = rng.random(children.shape) < config["mutation_rate"]
+    if mutate.any():
+        children[mutate] = random_genomes(config, rng, n)[mutate]
+    return children, parent1
 
 def evolve_prey(prey_list: list, config: dict):
     survivors = [p for p in prey_list if p.alive]
     if not survivors:
         survivors = prey_list.copy()
-
-    total_fitness = sum(p.fitness for p in survivors)
-    if total_fitness == 0:
-        for p in survivors:
-            p.fitness = 1.0
-        total_fitness = len(survivors)
-
-    def select_parent():
-        pick = random.uniform(0, total_fitness)
-        current = 0.0
-        for p in survivors:
-            current += p.fitness
-            if current >= pick:
-                return p
-        return survivors[-1]
-
-    new_generation = []
     n = len(prey_list)
-    for _ in range(n):
-        parent1 = select_parent()
-        parent2 = select_parent()
-        
-        child = copy.deepcopy(parent1)
-        for trait in child.traits:
-            child.traits[trait] = (parent1.traits[trait] + parent2.traits[trait]) / 2
-        
-        for trait in child.traits:
-            if random.random() < config["mutation_rate"]:
-                low, high = config["trait_range"][trait]
-                child.traits[trait] = random.uniform(low, high)
-        
+    if n == 0:
+        return
+
+    rng = np.random.default_rng(random.getrandbits(32))
+    fitness = np.array([p.fitness for p in survivors], dtype=float)
+    children, parents = evolve_genomes(genome_matrix(survivors), fitness, n, config, rng)
+
+    # Children inherit the first parent's body, as cloning the parent used to
+    inherited = [(survivors[i].speed, survivors[i].vision) for i in parents]
+
+    w, h = config["world_size"]
+    xs = rng.uniform(0, w, n)
+    ys = rng.uniform(0, h, n)
+    for i, child in enumerate(prey_list):
+        child.traits = dict(zip(TRAIT_NAMES, children[i].tolist()))
+        child.speed, child.vision = inherited[i]
         child.alive = True
         child.fitness = 0.0
-        
-        new_generation.append(child)
-
-    prey_list[:] = new_generation
-    
-    for child in prey_list:
-        child.x = random.uniform(0, config["world_size"][0])
-        child.y = random.uniform(0, config["world_size"][1])
+        child.x = float(xs[i])
+        child.y = float(ys[i])
+        child.vel_x = child.vel_y = 0.0
+        child.random_target = (child.x, child.y)
+        child.idle_until = 0
@@ -0,0 +1,139 @@
+import argparse
+import contextlib
+import copy
+import multiprocessing as mp
+import os
+import random
+from config import CONFIG
+from core.clock import SimClock
+from analysis.logger import log_generation, summarize_generation, write_summary_csv
+from logic.simulation import populate_environment, run_generation, next_generation
+
+
+def top_genomes(prey_list: list, k: int) -> list:
+    """Trait dicts of the k fittest prey."""
+    ranked = sorted(prey_list, key=lambda p: p.fitness, reverse=True)
+    return [dict(p.traits) for p in ranked[:k]]
+
+
+def immigrate(prey_list: list, genomes: list):
+    """Overwrite the traits of randomly chosen prey with incoming genomes."""
+    for prey, traits in zip(random.sample(prey_list, min(len(genomes), len(prey_list))), genomes):
+        prey.traits = dict(traits)
+
+
+def migration_sources(topology: str, n_islands: int, rng: random.Random) -> list:
+    """For every island, the list of islands it receives migrants from."""
+    if n_islands < 2:
+        return [[] for _ in range(n_islands)]
+    if topology == "ring":
+        return [[(i - 1) % n_islands] for i in range(n_islands)]
+    if topology == "fully_connected":
+        return [[j for j in range(n_islands) if j != i] for i in range(n_islands)]
+    if topology == "random":
+        return [[rng.choice([j for j in range(n_islands) if j != i])] for i in range(n_islands)]
+    raise ValueError(f"Unknown migration topology {topology!r}")
+
+
+def _island_worker(island_id: int, config: dict, conn):
+    """Own one world; run generations and exchange migrants on request."""
+    random.seed(config["seed"])
+    os.makedirs(config["log_dir"], exist_ok=True)
+    with open(os.path.join(config["log_dir"], "stdout.txt"), "w") as out, contextlib.redirect_stdout(out):
+        env = populate_environment(config, SimClock(config.get("tick_ms", 1000 / 60)))
+        gen = 0
+        migrants = config["islands"]["migrants"]
+        while True:
+            command, payload = conn.recv()
+            if command == "run":
+                rows, emigrants = [], []
+                for _ in range(payload):
+                    run_generation(env, gen, config)
+                    emigrants = top_genomes(env.prey, migrants)
+                    next_generation(env, config)
+                    log_generation(env, gen, config)
+                    rows.append({"island": island_id, **summarize_generation(env, gen)})
+                    gen += 1
+                conn.send((rows, emigrants))
+            elif command == "migrate":
+                immigrate(env.prey, payload)
+            elif command == "stop":
+                break
+    conn.close()
+
+
+def run_islands(config: dict) -> list:
+    """Evolve `islands.count` independent worlds in parallel with periodic migration.
+
+    Every `migration_interval` generations each island sends its top
+    `migrants` genomes along the configured topology. Returns one summary
+    row per island and generation, also written to ``<log_dir>/islands.csv``.
+    """
+    settings = config["islands"]
+    n_islands = settings["count"]
+    interval = settings["migration_interval"]
+    base_seed = config.get("seed")
+    if base_seed is None:
+        base_seed = random.randrange(2**31)
+    rng = random.Random(base_seed)
+
+    ctx = mp.get_context()
+    islands = []
+    for i in range(n_islands):
+        island_config = copy.deepcopy(config)
+        island_config["headless"] = True
+        island_config["async_plots"] = False
+        island_config["seed"] = base_seed + i
+        island_config["log_dir"] = os.path.join(config["log_dir"], f"island_{i}")
+        parent_conn, child_conn = ctx.Pipe()
+        process = ctx.Process(target=_island_worker, args=(i, island_config, child_conn), daemon=True)
+        process.start()
+        islands.append((process, parent_conn))
+
+    rows = []
+    remaining = config["num_generations"]
+    try:
+        while remaining > 0:
+            epoch = min(interval, remaining)
+            remaining -= epoch
+            for _, conn in islands:
+                conn.send(("run", epoch))
+            results = [conn.recv() for _, conn in islands]
+            for island_rows, _ in results:
+                rows.extend(island_rows)
+            print(f"Islands finished {config['num_generations'] - remaining} generations")
+
+            if remaining > 0:
+                sources = migration_sources(settings["topology"], n_islands, rng)
+                for (_, conn), senders in zip(islands, sources):
+                    incoming = [g for s in senders for g in results[s][1]]
+                    conn.send(("migrate", incoming))
+    finally:
+        for process, conn in islands:
+            # A crashed island has closed its end; don't mask the original error
+            if process.is_alive():
+                try:
+                    conn.send(("stop", None))
+                except OSError:
+                    pass
+            process.join()
+
+    rows.sort(key=lambda r: (r["island"], r["generation"]))
+    write_summary_csv(rows, os.path.join(config["log_dir"], "islands.csv"))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run island-model evolution across processes.")
+    parser.add_argument("--islands", type=int, default=CONFIG["islands"]["count"])
+    parser.add_argument("--topology", default=CONFIG["islands"]["topology"])
+    args = parser.parse_args()
+
+    config = copy.deepcopy(CONFIG)
+    config["islands"].update(count=args.islands, topology=args.topology)
+    rows = run_islands(config)
+    print(f"{len(rows)} island generation rows written to {os.path.join(config['log_dir'], 'islands.csv')}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,9 @@
 import random
 import json
+import re
+import numpy as np
+
+ACTIONS = ["up", "down", "left", "right", "stay"]
 
 class QLearningAgent:
     def __init__(self, actions: list, learning_rate: float, discount_factor: float, epsilon: float, config: dict):
@@ -7,7 +11,6 @@ class QLearningAgent:
         self.alpha = learning_rate
         self.gamma = discount_factor
         self.epsilon = epsilon
-        self.q_table = {}
         self.config = config
 
         w, h = config["world_size"]
@@ -15,12 +18,19 @@ class QLearningAgent:
         self.grid_cols = w // self.cell_size
         self.grid_rows = h // self.cell_size
 
-    def get_state(self, predator, prey_list):
-        col = int(predator.x // self.cell_size)
-        row = int(predator.y // self.cell_size)
+        self.q_table = {}
+
+    def cell_of(self, x, y):
+        col = int(x // self.cell_size)
+        row = int(y // self.cell_size)
         col = max(0, min(col, self.grid_cols - 1))
         row = max(0, min(row, self.grid_rows - 1))
+        return col, row
+
+    def encode_state(self, col, row, direction):
+        return f"C{col}_{row}|DIR_{direction}"
 
+    def get_state(self, predator, prey_list):
         nearest_prey = None
         min_dist = float("inf")
         for p in prey_list:
@@ -32,20 +42,28 @@ class QLearningAgent:
             if dist < min_dist:
                 min_dist = dist
                 nearest_prey = p
+        return self.state_for(predator, nearest_prey)
 
+    def state_for(self, predator, nearest_prey):
+        """State of `predator` given its nearest live prey (None if there is none)."""
         if nearest_prey is None:
+            return self.state_at(predator.x, predator.y, None)
+        return self.state_at(predator.x, predator.y, (nearest_prey.x - predator.x, nearest_prey.y - predator.y))
+
+    def state_at(self, x, y, offset):
+        """State of a predator at (x, y) whose nearest live prey lies `offset` away, or None."""
+        col, row = self.cell_of(x, y)
+        if offset is None:
             direction = "none"
         else:
-            dx = nearest_prey.x - predator.x
-            dy = nearest_prey.y - predator.y
+            dx, dy = offset
 
             if abs(dx) > abs(dy):
                 direction = "right" if dx > 0 else "left"
             else:
                 direction = "down" if dy > 0 else "up"
 
-        state = f"C{col}_{row}|DIR_{direction}"
-        return state
+        return self.encode_state(col, row, direction)
 
     def choose_action(self, state):
         if state not in self.q_table:
@@ -70,6 +88,27 @@ class QLearningAgent:
         new_q = current_q + self.alpha * (reward + self.gamma * max_next_q - current_q)
         self.q_table[state][action] = new_q
 
+    def update_batch(self, transitions):
+        """Apply many (state, action, reward, next_state) updates at once.
+
+        Every TD target is computed from the table as it was before the batch,
+        so the result does not depend on transition order. Transitions that
+        hit the same (state, action) have their targets averaged and applied
+        as a single update.
+        """
+        targets = {}
+        for state, action, reward, next_state in transitions:
+            for s in (state, next_state):
+                if s not in self.q_table:
+                    self.q_table[s] = {a: 0.0 for a in self.actions}
+            max_next_q = max(self.q_table[next_state].values())
+            targets.setdefault((state, action), []).append(reward + self.gamma * max_next_q)
+
+        for (state, action), values in targets.items():
+            current_q = self.q_table[state][action]
+            target = sum(values) / len(values)
+            self.q_table[state][action] = current_q + self.alpha * (target - current_q)
+
     def save_to_file(self, path):
         with open(path, 'w') as f:
             json.dump(self.q_table, f)
@@ -77,3 +116,278 @@ class QLearningAgent:
     def load_from_file(self, path):
         with open(path, 'r') as f:
             self.q_table = json.load(f)
+
+
+DIRECTIONS = ["up", "down", "left", "right", "none"]
+STATE_KEY = re.compile(r"C(\d+)_(\d+)\|DIR_(\w+)$")
+
+
+class ArrayQLearningAgent(QLearningAgent):
+    """Q-learner whose states are integer indices into a dense NumPy table.
+
+    A state is ``(row * grid_cols + col) * len(DIRECTIONS) + direction``.
+    `q_table` still reads and writes the string-keyed dict format, so saved
+    files stay interchangeable with `QLearningAgent`.
+    """
+
+    def __init__(self, actions: list, learning_rate: float, discount_factor: float, epsilon: float, config: dict):
+        self.action_index = {a: i for i, a in enumerate(actions)}
+        self.direction_index = {d: i for i, d in enumerate(DIRECTIONS)}
+        super().__init__(actions, learning_rate, discount_factor, epsilon, config)
+
+    @property
+    def n_states(self):
+        return self.grid_cols * self.grid_rows * len(DIRECTIONS)
+
+    def encode_state(self, col, row, direction):
+        return (row * self.grid_cols + col) * len(DIRECTIONS) + self.direction_index[direction]
+
+    def decode_state(self, state):
+        cell, direction = divmod(int(state), len(DIRECTIONS))
+        row, col = divmod(cell, self.grid_cols)
+        return f"C{col}_{row}|DIR_{DIRECTIONS[direction]}"
+
+    @property
+    def q_table(self):
+        return {
+            self.decode_state(s): dict(zip(self.actions, self.q[s].tolist()))
+            for s in np.flatnonzero(self.visited)
+        }
+
+    @q_table.setter
+    def q_table(self, table):
+        self.q = np.zeros((self.n_states, len(self.actions)))
+        self.visited = np.zeros(self.n_states, dtype=bool)
+        for key, values in table.items():
+            match = STATE_KEY.match(key)
+            if match is None:
+                raise ValueError(f"Unrecognised Q-table state {key!r}")
+            col, row, direction = int(match.group(1)), int(match.group(2)), match.group(3)
+            if col >= self.grid_cols or row >= self.grid_rows:
+                raise ValueError(f"State {key!r} lies outside the {self.grid_cols}x{self.grid_rows} grid")
+            state = self.encode_state(col, row, direction)
+            self.visited[state] = True
+            for action, value in values.items():
+                self.q[state, self.action_index[action]] = value
+
+    def choose_action(self, state):
+        self.visited[state] = True
+
+        if random.random() < self.epsilon:
+            return random.choice(self.actions)
+        else:
+            action_values = self.q[state]
+            best_actions = np.flatnonzero(action_values == action_values.max())
+            return self.actions[random.choice(best_actions.tolist())]
+
+    def update_q(self, state, action, reward, next_state):
+        self.visited[state] = True
+        self.visited[next_state] = True
+
+        a = self.action_index[action]
+        current_q = self.q[state, a]
+        max_next_q = self.q[next_state].max()
+        self.q[state, a] = current_q + self.alpha * (reward + self.gamma * max_next_q - current_q)
+
+    def choose_actions(self, states, rng) -> np.ndarray:
+        """Epsilon-greedy action indices for an array of states, ties broken at random."""
+        states = np.asarray(states)
+        self.visited[states] = True
+        q = self.q[states]
+        noise = rng.random(q.shape)
+        greedy = np.where(q == q.max(axis=-1, keepdims=True), noise, -1.0).argmax(axis=-1)
+        explore = rng.random(states.shape) < self.epsilon
+        return np.where(explore, rng.integers(0, len(self.actions), states.shape), greedy)
+
+    def update_batch(self, transitions):
+        states, actions, rewards, next_states = zip(*transitions)
+        actions = [self.action_index[a] for a in actions]
+        self.update_arrays(states, actions, rewards, next_states)
+
+    def update_arrays(self, states, actions, rewards, next_states):
+        """`update_batch` for arrays of states, action indices, rewards and next states."""
+        states = np.asarray(states).ravel()
+        next_states = np.asarray(next_states).ravel()
+        actions = np.asarray(actions).ravel()
+        self.visited[states] = True
+        self.visited[next_states] = True
+
+        targets = np.asarray(rewards, dtype=float).ravel() + self.gamma * self.q[next_states].max(axis=1)
+        cells, inverse = np.unique(states * len(self.actions) + actions, return_inverse=True)
+        mean_targets = np.bincount(inverse, weights=targets) / np.bincount(inverse)
+
+        flat = self.q.reshape(-1)
+        flat[cells] += self.alpha * (mean_targets - flat[cells])
+
+
+# Upper edges (pixels) of the distance-to-prey buckets; the last bucket is open-ended
+DISTANCE_BUCKETS = (25, 50, 100, 200, 400)
+# Walls closer than this (pixels) start to show up in the features
+WALL_RANGE = 100.0
+# bias, unit vector to prey (2), distance buckets + "no prey", wall proximity (4)
+N_FEATURES = 1 + 2 + len(DISTANCE_BUCKETS) + 2 + 4
+
+
+class LinearQLearningAgent(QLearningAgent):
+    """Q-learner with Q(s, a) = weights[a] . features(s) instead of a table.
+
+    A state is a feature vector: a bias, the unit vector to the nearest
+    prey, a one-hot distance bucket (or "no prey") and how close each wall
+    is. Memory is one weight row per action whatever the world size, and
+    what is learnt in one place carries over to every cell. Updates are
+    normalised by the squared feature norm so `learning_rate` keeps the
+    same meaning as for the tables.
+    """
+
+    def __init__(self, actions: list, learning_rate: float, discount_factor: float, epsilon: float, config: dict):
+        self.actions = actions
+        self.alpha = learning_rate
+        self.gamma = discount_factor
+        self.epsilon = epsilon
+        self.config = config
+        self.action_index = {a: i for i, a in enumerate(actions)}
+        self.weights = np.zeros((len(actions), N_FEATURES))
+
+    def state_at(self, x, y, offset):
+        features = np.zeros(N_FEATURES)
+        features[0] = 1.0
+        if offset is None:
+            features[3 + len(DISTANCE_BUCKETS) + 1] = 1.0
+        else:
+            dx, dy = offset
+            dist = (dx * dx + dy * dy) ** 0.5
+            if dist > 0:
+                features[1] = dx / dist
+                features[2] = dy / dist
+            features[3 + int(np.searchsorted(DISTANCE_BUCKETS, dist, side="right"))] = 1.0
+
+        w, h = self.config["world_size"]
+        walls = features[-4:]
+        walls[:] = (x, w - x, y, h - y)
+        np.clip(1.0 - walls / WALL_RANGE, 0.0, 1.0, out=walls)
+        return features
+
+    def choose_action(self, state):
+        if random.random() < self.epsilon:
+            return random.choice(self.actions)
+        else:
+            action_values = self.weights @ state
+            best_actions = np.flatnonzero(action_values == action_values.max())
+            return self.actions[random.choice(best_actions.tolist())]
+
+    def update_q(self, state, action, reward, next_state):
+        a = self.action_index[action]
+        current_q = self.weights[a] @ state
+        max_next_q = (self.weights @ next_state).max()
+        td = reward + self.gamma * max_next_q - current_q
+        self.weights[a] += self.alpha * td / (state @ state) * state
+
+    def update_batch(self, transitions):
+        """Vectorised TD update; every target uses the weights from before the batch.
+
+        Updates for the same action are averaged, as the tables average
+        updates that hit the same cell.
+        """
+        states, actions, rewards, next_states = zip(*transitions)
+        states = np.asarray(states)
+        next_states = np.asarray(next_states)
+        actions = np.array([self.action_index[a] for a in actions])
+
+        targets = np.asarray(rewards, dtype=float) + self.gamma * (next_states @ self.weights.T).max(axis=1)
+        td = targets - np.einsum("ij,ij->i", states, self.weights[actions])
+        steps = (self.alpha * td / np.einsum("ij,ij->i", states, states))[:, None] * states
+
+        delta = np.zeros_like(self.weights)
+        np.add.at(delta, actions, steps)
+        counts = np.bincount(actions, minlength=len(self.actions))
+        self.weights += delta / np.maximum(counts, 1)[:, None]
+
+    @property
+    def q_table(self):
+        return {"weights": self.weights.tolist()}
+
+    @q_table.setter
+    def q_table(self, table):
+        weights = np.asarray(table["weights"], dtype=float)
+        if weights.shape != self.weights.shape:
+            raise ValueError(f"Expected weights of shape {self.weights.shape}, got {weights.shape}")
+        self.weights = weights
+
+
+class SharedQLearner:
+    """One Q-learner shared by every predator.
+
+    `update_q` only queues the transition; `flush` applies everything queued
+    during a tick through the wrapped learner's `update_batch`.
+    """
+
+    def __init__(self, learner):
+        self.learner = learner
+        self.pending = []
+
+    @property
+    def actions(self):
+        return self.learner.actions
+
+    @property
+    def q_table(self):
+        return self.learner.q_table
+
+    def get_state(self, predator, prey_list):
+        return self.learner.get_state(predator, prey_list)
+
+    def state_for(self, predator, nearest_prey):
+        return self.learner.state_for(predator, nearest_prey)
+
+    def state_at(self, x, y, offset):
+        return self.learner.state_at(x, y, offset)
+
+    def cell_of(self, x, y):
+        return self.learner.cell_of(x, y)
+
+    def encode_state(self, col, row, direction):
+        return self.learner.encode_state(col, row, direction)
+
+    def choose_action(self, state):
+        return self.learner.choose_action(state)
+
+    def update_q(self, state, action, reward, next_state):
+        self.pending.append((state, action, reward, next_state))
+
+    def flush(self):
+        if self.pending:
+            self.learner.update_batch(self.pending)
+            self.pending = []
+
+    def save_to_file(self, path):
+        self.learner.save_to_file(path)
+
+    def load_from_file(self, path):
+        self.learner.load_from_file(path)
+
+
+LEARNERS = {
+    "dict": QLearningAgent,
+    "array": ArrayQLearningAgent,
+    "linear": LinearQLearningAgent,
+}
+
+
+def build_q_agent(actions: list, config: dict):
+    """Create the Q-learner selected by ``config["rl"]["learner"]``."""
+    rl_cfg = config["rl"]
+    name = rl_cfg.get("learner", "dict")
+    if name not in LEARNERS:
+        raise ValueError(f"Unknown rl learner {name!r}, expected one of {sorted(LEARNERS)}")
+    return LEARNERS[name](actions,
+                          rl_cfg["learning_rate"],
+                          rl_cfg["discount_factor"],
+                          rl_cfg["epsilon"],
+                          config)
+
+
+def build_shared_learner(config: dict):
+    """Return a SharedQLearner when ``config["rl"]["shared"]`` is set, else None."""
+    if not config["rl"].get("shared", False):
+        return None
+    return SharedQLearner(build_q_agent(ACTIONS, config))
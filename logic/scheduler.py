@@ -0,0 +1,86 @@
+import math
+import time
+
+
+class FrameScheduler:
+    """Decides how many fixed simulation ticks to run between rendered frames.
+
+    At speed 1.0 one tick of `tick_ms` simulated time runs per `tick_ms` of
+    wall time; higher speeds run more ticks per frame and lower speeds
+    repeat frames. Rendering plus ticks never take more than
+    `frame_budget_ms` per frame, so events are still handled at the target
+    rate. Speed ``inf`` runs as many ticks as fit in the budget.
+    """
+
+    def __init__(self, target_fps: float = 60.0, tick_ms: float = 1000 / 60, frame_budget_ms: float = None):
+        self.frame_s = 1.0 / target_fps
+        self.budget_s = (frame_budget_ms / 1000.0) if frame_budget_ms is not None else self.frame_s
+        self.ticks_per_frame = (1000.0 / target_fps) / tick_ms
+        self.accumulator = 0.0
+        self.pending = 0
+        self.ran = 0
+        self.speed = 1.0
+        self.frame_start = time.perf_counter()
+
+    def begin_frame(self, speed: float):
+        self.frame_start = time.perf_counter()
+        self.speed = speed
+        self.ran = 0
+        if math.isinf(speed):
+            self.pending = math.inf
+        else:
+            self.accumulator += speed * self.ticks_per_frame
+            self.pending = int(self.accumulator)
+            self.accumulator -= self.pending
+
+    def tick_due(self) -> bool:
+        """True if another tick fits in this frame; call once per tick."""
+        if self.pending <= 0:
+            return False
+        if self.ran and time.perf_counter() - self.frame_start > self.budget_s:
+            # Behind schedule: drop the backlog rather than spiral
+            self.pending = 0
+            self.accumulator = 0.0
+            return False
+        self.pending -= 1
+        self.ran += 1
+        return True
+
+    def end_frame(self):
+        """Sleep off the rest of the frame unless running flat out."""
+        if math.isinf(self.speed):
+            return
+        remaining = self.frame_s - (time.perf_counter() - self.frame_start)
+        if remaining > 0:
+            time.sleep(remaining)
+
+
+def make_scheduler(config: dict) -> FrameScheduler:
+    return FrameScheduler(config.get("target_fps", 60), config.get("tick_ms", 1000 / 60),
+                          config.get("frame_budget_ms"))
+
+
+def run_steps(steps: int, step_func, render_func, scheduler: FrameScheduler, config: dict, profiler) -> int:
+    """Run up to `steps` ticks, rendering once per scheduled frame; returns the ticks run.
+
+    `render_func(step)` handles input and returns False while paused;
+    `config["simulation_speed"]` is re-read every frame so the UI can change it.
+    A truthy return from `step_func` ends the run after that tick.
+    """
+    step = 0
+    while step < steps:
+        scheduler.begin_frame(config.get("simulation_speed", 1.0))
+        with profiler.phase("render"):
+            should_continue = render_func(step)
+
+        while should_continue is False:
+            time.sleep(0.1)
+            should_continue = render_func(step)
+
+        while step < steps and scheduler.tick_due():
+            stop = step_func()
+            step += 1
+            if stop:
+                steps = step
+        scheduler.end_frame()
+    return step
@@ -0,0 +1,225 @@
+import multiprocessing as mp
+import queue
+from multiprocessing import shared_memory
+import numpy as np
+from analysis.logger import log_generation
+from analysis.visualization import plot_reward_curve
+
+FIELDS = ("x", "y", "vel_x", "vel_y", "radius", "vision", "fitness", "total_reward")
+HEADER_SLOTS = 2  # latest slot, done flag
+META_SLOTS = 4  # seq, count, generation, step
+PREDATOR = 1
+
+# Config keys the UI may change while the engine runs
+SYNCED_KEYS = ("trait_range", "predator_speed", "predator_vision", "mutation_rate",
+               "num_prey", "num_predators", "simulation_speed")
+
+
+class SnapshotBuffer:
+    """Double-buffered agent snapshot in shared memory.
+
+    The engine writes into the slot readers are not pointed at, then flips
+    `latest`. Each slot carries a sequence number that is odd while it is
+    being written, so a reader that raced a writer retries instead of
+    returning a torn snapshot.
+    """
+
+    def __init__(self, capacity: int, name: str = None):
+        self.capacity = capacity
+        slot_bytes = META_SLOTS * 8 + len(FIELDS) * capacity * 4 + 2 * capacity
+        size = HEADER_SLOTS * 8 + 2 * slot_bytes
+        self.owner = name is None
+        self.shm = shared_memory.SharedMemory(name=name, create=self.owner, size=size)
+        buf = self.shm.buf
+        self.header = np.ndarray(HEADER_SLOTS, np.int64, buf)
+        self.slots = []
+        offset = HEADER_SLOTS * 8
+        for _ in range(2):
+            meta = np.ndarray(META_SLOTS, np.int64, buf, offset)
+            offset += META_SLOTS * 8
+            columns = np.ndarray((len(FIELDS), capacity), np.float32, buf, offset)
+            offset += columns.nbytes
+            flags = np.ndarray((2, capacity), np.uint8, buf, offset)  # kind, alive
+            offset += flags.nbytes
+            self.slots.append((meta, columns, flags))
+        if self.owner:
+            self.header[:] = 0
+            for meta, _, _ in self.slots:
+                meta[:] = 0
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    @property
+    def done(self) -> bool:
+        return bool(self.header[1])
+
+    def mark_done(self):
+        self.header[1] = 1
+
+    def publish(self, env, gen: int, step: int):
+        slot = 1 - int(self.header[0])
+        meta, columns, flags = self.slots[slot]
+        meta[0] += 1
+        count = _write_columns(env, columns, flags)
+        meta[1:] = (count, gen, step)
+        meta[0] += 1
+        self.header[0] = slot
+
+    def read(self, retries: int = 100):
+        """Copy of the latest complete snapshot, or None before the first publish."""
+        for _ in range(retries):
+            meta, columns, flags = self.slots[int(self.header[0])]
+            seq = int(meta[0])
+            if seq == 0:
+                return None
+            if seq % 2:
+                continue
+            count, gen, step = (int(v) for v in meta[1:])
+            snapshot = (columns[:, :count].copy(), flags[:, :count].copy(), gen, step)
+            if int(meta[0]) == seq:
+                return snapshot
+        return None
+
+    def close(self):
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+def _write_columns(env, columns: np.ndarray, flags: np.ndarray) -> int:
+    capacity = columns.shape[1]
+    state = getattr(env, "state", None)
+    if state is not None:
+        count = min(len(state.x), capacity)
+        for i, name in enumerate(FIELDS):
+            columns[i, :count] = getattr(state, name)[:count]
+        flags[0, :count] = 0
+        flags[0, state.predators.start:count] = PREDATOR
+        flags[1, :count] = state.alive[:count]
+        return count
+
+    agents = env.agents[:capacity]
+    for j, agent in enumerate(agents):
+        columns[:, j] = [getattr(agent, name) for name in FIELDS]
+        flags[0, j] = PREDATOR if agent.entity_class == "predator" else 0
+        flags[1, j] = agent.alive
+    return len(agents)
+
+
+class SnapshotAgent:
+    __slots__ = ("entity_class", "alive") + FIELDS
+
+
+class SnapshotEnv:
+    """Read-only stand-in for an environment, built from one snapshot for the view."""
+
+    def __init__(self, config: dict, columns: np.ndarray, flags: np.ndarray):
+        self.config = config
+        self.agents, self.prey, self.predators = [], [], []
+        for j in range(columns.shape[1]):
+            agent = SnapshotAgent()
+            for i, name in enumerate(FIELDS):
+                setattr(agent, name, float(columns[i, j]))
+            agent.radius = int(agent.radius)
+            agent.alive = bool(flags[1, j])
+            if flags[0, j] == PREDATOR:
+                agent.entity_class = "predator"
+                self.predators.append(agent)
+            else:
+                agent.entity_class = "prey"
+                self.prey.append(agent)
+            self.agents.append(agent)
+
+
+class _Stop(Exception):
+    pass
+
+
+def _sim_worker(config: dict, shm_name: str, capacity: int, commands, resume_from: str = None):
+    from logic.simulation import run_simulation
+
+    buffer = SnapshotBuffer(capacity, shm_name)
+    paused = False
+    reward_history = []
+
+    def publish(env, gen, step):
+        nonlocal paused
+        while True:
+            try:
+                command, payload = commands.get_nowait()
+            except queue.Empty:
+                break
+            if command == "config":
+                config.update(payload)
+            elif command == "pause":
+                paused = payload
+            elif command == "stop":
+                raise _Stop
+        buffer.publish(env, gen, step)
+        return not paused
+
+    def logger(env, gen, config):
+        log_generation(env, gen, config)
+        if env.predators:
+            reward_history.append(sum(pr.total_reward for pr in env.predators) / len(env.predators))
+        env.plotter.submit("trait_distribution", [{"traits": p.traits} for p in env.prey], gen, config)
+
+    try:
+        run_simulation(config, logger_func=logger, visualization_func=publish, resume_from=resume_from)
+        plot_reward_curve(reward_history, config)
+    except _Stop:
+        pass
+    finally:
+        buffer.mark_done()
+        buffer.shm.close()
+
+
+class SimProcess:
+    """The engine running in a child process, seen through a SnapshotBuffer.
+
+    `snapshot()` returns the latest complete frame as a SnapshotEnv; config
+    changes and pause state are sent back over a command queue.
+    """
+
+    def __init__(self, config: dict, capacity: int = None, resume_from: str = None):
+        ctx = mp.get_context("spawn")
+        # Room for the largest populations the sidebar sliders allow
+        capacity = capacity or max(config["num_prey"], 100) + max(config["num_predators"], 20)
+        self.config = config
+        self.buffer = SnapshotBuffer(capacity)
+        self.commands = ctx.Queue()
+        self.synced = {key: config[key] for key in SYNCED_KEYS if key in config}
+        self.process = ctx.Process(target=_sim_worker,
+                                   args=(config, self.buffer.name, capacity, self.commands, resume_from))
+        self.process.start()
+        self.gen = self.step = 0
+
+    @property
+    def running(self) -> bool:
+        return self.process.is_alive() and not self.buffer.done
+
+    def snapshot(self):
+        data = self.buffer.read()
+        if data is None:
+            return None
+        columns, flags, self.gen, self.step = data
+        return SnapshotEnv(self.config, columns, flags)
+
+    def sync_config(self):
+        """Forward any UI-side changes to the synced config keys."""
+        changed = {key: self.config[key] for key in self.synced if self.config[key] != self.synced[key]}
+        if changed:
+            self.synced.update(changed)
+            self.commands.put(("config", changed))
+
+    def set_paused(self, paused: bool):
+        self.commands.put(("pause", paused))
+
+    def stop(self):
+        if self.process.is_alive():
+            self.commands.put(("stop", None))
+        self.process.join()
+        if self.buffer.shm.buf is not None:
+            self.buffer.close()
@@ -1,98 +1,184 @@
 from core.environment import Environment
+from core.clock import SimClock
 from core.prey import Prey
 from core.predator import Predator
 from logic.evolution import evolve_prey
-from analysis.clustering import cluster_prey_traits
-from analysis.visualization import plot_cluster_centroids
+from logic.rl import build_shared_learner
+from analysis.clustering import IncrementalClusterer
+from analysis.plot_worker import make_plotter
+from analysis.profiler import make_profiler, print_profile
+from logic.termination import run_ticks
+from logic.checkpoint import maybe_checkpoint, resume_state
 import random
-import time
-
-def run_simulation(config: dict, logger_func, visualization_func):
-    env = Environment(config)
+import numpy as np
+
+def generation_summary(prey_list) -> dict:
+    """Statistics about the prey that survived a generation, taken before evolution."""
+    survivors = [p for p in prey_list if p.alive]
+    return {
+        "survivors": len(survivors),
+        "avg_survivor_fitness": sum(p.fitness for p in survivors) / len(survivors) if survivors else 0.0,
+    }
+
+def spawn_prey(x: float, y: float, config: dict, env) -> Prey:
+    """A prey at (x, y) with random traits, recycled from `env.pool` when possible."""
+    p = env.pool.acquire("prey")
+    if p is None:
+        p = Prey(x, y, config, env)
+    else:
+        p.respawn(x, y)
+    p.traits = {
+        "speed": random.uniform(*config["trait_range"]["speed"]),
+        "agility": random.uniform(*config["trait_range"]["agility"]),
+        "vision": random.uniform(*config["trait_range"]["vision"])
+    }
+    return p
+
+def populate_environment(config: dict, clock) -> Environment:
+    env = Environment(config, clock)
 
     center_x, center_y = config["world_size"][0] / 2, config["world_size"][1] / 2
     for _ in range(config["num_prey"]):
         x = random.uniform(center_x - 100, center_x + 100)
         y = random.uniform(center_y - 100, center_y + 100)
-        p = Prey(x, y, config, env)
-        p.traits = {
-            "speed": random.uniform(*config["trait_range"]["speed"]),
-            "agility": random.uniform(*config["trait_range"]["agility"]),
-            "vision": random.uniform(*config["trait_range"]["vision"])
-        }
-        env.add_agent(p)
+        env.add_agent(spawn_prey(x, y, config, env))
 
+    env.shared_learner = build_shared_learner(config)
     for _ in range(config["num_predators"]):
         x = random.uniform(center_x - 200, center_x + 200)
         y = random.uniform(center_y - 200, center_y + 200)
-        pr = Predator(x, y, config, env)
+        pr = Predator(x, y, config, env, rl_agent=env.shared_learner)
         env.add_agent(pr)
+    env.rebuild_index()
+    return env
 
-    for gen in range(config["num_generations"]):
-        print(f"=== Generation {gen+1} ===")
-        env.reset_generation()
-
+def step_environment(env: Environment):
+    """Advance every agent by one tick."""
+    profiler = env.profiler
+    with profiler.phase("predator_move"):
         for predator in env.predators:
-            predator.last_state = predator.rl_agent.get_state(predator, env.prey)
-            predator.last_action = random.choice(predator.rl_agent.actions)
-
+            predator.handle_movement()
+    with profiler.phase("predator_update"):
         for predator in env.predators:
-            predator.total_reward = 0.0
-
-        for step in range(config["time_steps_per_generation"]):
-            should_continue = visualization_func(env, gen, step)
-            
-            while should_continue is False:
-                time.sleep(0.1) 
-                should_continue = visualization_func(env, gen, step)
-            
-            for predator in env.predators:
-                predator.handle_movement()
-            for predator in env.predators:
-                predator.update()
-            for predator in env.predators:
-                predator.learn()
-
-            for prey in env.prey:
-                if prey.alive:
-                    prey.handle_movement()
-                    prey.update()
-
-            env.remove_dead_agents()
-
-        evolve_prey(env.prey, config)
-
-        new_prey_list = []
-        for _ in range(config["num_prey"]):
-            if len(env.prey) > config["num_prey"]:
-                new_prey_list = env.prey[:config["num_prey"]]
-            else:
-                new_prey_list = env.prey.copy()
-                while len(new_prey_list) < config["num_prey"]:
-                    x = random.uniform(0, config["world_size"][0])
-                    y = random.uniform(0, config["world_size"][1])
-                    p = Prey(x, y, config, env)
-                    p.traits = {
-                        "speed": random.uniform(*config["trait_range"]["speed"]),
-                        "agility": random.uniform(*config["trait_range"]["agility"]),
-                        "vision": random.uniform(*config["trait_range"]["vision"])
-                    }
-                    new_prey_list.append(p)
-            for child in new_prey_list:
-                child.alive = True
-                child.fitness = 0.0
-        env.prey = new_prey_list
-
-        env.agents = []
-        for p in env.prey:
-            env.agents.append(p)
-        for pr in env.predators:
-            env.agents.append(pr)
-
+            predator.update()
+    with profiler.phase("predator_learn"):
+        for predator in env.predators:
+            predator.learn()
+        if env.shared_learner is not None:
+            env.shared_learner.flush()
+
+    with profiler.phase("prey"):
+        for prey in env.prey:
+            if prey.alive:
+                prey.handle_movement()
+                prey.update()
+
+    with profiler.phase("remove_dead"):
+        env.remove_dead_agents()
+    env.clock.tick()
+    profiler.step()
+
+def run_generation(env: Environment, gen: int, config: dict, visualization_func=None):
+    """Run one generation's time steps and record its survivor statistics."""
+    print(f"=== Generation {gen+1} ===")
+    env.reset_generation()
+
+    for predator in env.predators:
+        predator.last_state = predator.rl_agent.state_for(predator, env.nearest_prey(predator))
+        predator.last_action = random.choice(predator.rl_agent.actions)
+
+    for predator in env.predators:
+        predator.total_reward = 0.0
+
+    env.profiler.start_steps()
+    render = None if visualization_func is None else lambda step: visualization_func(env, gen, step)
+    ticks, reason = run_ticks(env, config["time_steps_per_generation"], lambda: step_environment(env),
+                              render, config)
+
+    env.compact()
+    env.generation_stats = generation_summary(env.prey)
+    env.generation_stats.update(ticks=ticks, terminated_by=reason)
+
+def next_generation(env: Environment, config: dict):
+    """Evolve the survivors and refill the prey population to `num_prey`."""
+    evolve_prey(env.prey, config)
+
+    new_prey_list = env.prey[:config["num_prey"]]
+    env.pool.release(env.prey[config["num_prey"]:])
+    while len(new_prey_list) < config["num_prey"]:
+        x = random.uniform(0, config["world_size"][0])
+        y = random.uniform(0, config["world_size"][1])
+        new_prey_list.append(spawn_prey(x, y, config, env))
+    for child in new_prey_list:
+        child.alive = True
+        child.fitness = 0.0
+    env.set_agents(new_prey_list + env.predators)
+
+def make_clusterer(config: dict) -> IncrementalClusterer:
+    return IncrementalClusterer(config["k_clusters"], config.get("cluster_interval", 1))
+
+def finish_generation(env, gen: int, config: dict, logger_func):
+    """Generation-boundary reporting: clustering, plots, profile and logs.
+
+    Clustering and its plot only run every `cluster_interval` generations.
+    Logging runs last so the profile can go into the generation's log;
+    its own time is reported with the next generation.
+    """
+    profiler = env.profiler
+    if env.clusterer.due(gen):
+        with profiler.phase("clustering"):
+            labels, centroids, drift = env.clusterer.update(env.prey, gen)
+        if centroids is not None:
+            env.generation_stats["clusters"] = {
+                "centroids": centroids.tolist(),
+                "sizes": np.bincount(labels, minlength=len(centroids)).tolist(),
+                "drift": drift.tolist() if drift is not None else None,
+            }
+        with profiler.phase("plotting"):
+            env.plotter.submit("cluster_centroids", centroids, gen, config)
+
+    if profiler.enabled:
+        env.generation_stats["profile"] = profiler.summary()
+        print_profile(gen, env.generation_stats["profile"])
+        profiler.reset()
+
+    with profiler.phase("logging"):
         logger_func(env, gen, config)
 
-        labels, centroids = cluster_prey_traits(env.prey, config["k_clusters"])
-        plot_cluster_centroids(centroids, gen, config)
+def run_simulation(config: dict, logger_func, visualization_func=None, resume_from: str = None):
+    """Run `num_generations` generations, optionally continuing from a checkpoint file."""
+    resume = resume_state(resume_from, config) if resume_from else None
+    if resume is None and config.get("seed") is not None:
+        random.seed(config["seed"])
+
+    # Every tick advances a simulated clock by a fixed step, so behaviour does
+    # not depend on how fast the loop runs or how often frames are drawn
+    if config.get("headless", False):
+        visualization_func = None
+    clock = SimClock(config.get("tick_ms", 1000 / 60))
+
+    if config.get("engine") == "vectorized":
+        from logic.vector_simulation import run_vectorized_simulation
+        return run_vectorized_simulation(config, logger_func, visualization_func, clock, resume)
+
+    if resume is None:
+        env = populate_environment(config, clock)
+        env.clusterer = make_clusterer(config)
+        start = 0
+    else:
+        env, start = resume["env"], resume["generation"]
+    env.profiler = make_profiler(config)
+    env.plotter = make_plotter(config)
+
+    try:
+        for gen in range(start, config["num_generations"]):
+            run_generation(env, gen, config, visualization_func)
+            with env.profiler.phase("evolution"):
+                next_generation(env, config)
+            finish_generation(env, gen, config, logger_func)
+            maybe_checkpoint(env, gen, config)
+    finally:
+        env.plotter.close()
 
     print("Simulation completed.")
 
@@ -0,0 +1,127 @@
+import argparse
+import contextlib
+import copy
+import itertools
+import json
+import os
+import random
+from multiprocessing import Pool
+from config import CONFIG
+from analysis.logger import log_generation, summarize_generation, write_summary_csv
+from logic.simulation import run_simulation
+
+
+def set_param(config: dict, key: str, value):
+    """Set a config value by dotted path, e.g. ``"rl.epsilon"``."""
+    *parents, leaf = key.split(".")
+    node = config
+    for part in parents:
+        node = node[part]
+    if leaf not in node:
+        raise KeyError(f"Unknown config parameter {key!r}")
+    node[leaf] = value
+
+
+def expand_grid(grid: dict) -> list:
+    """Every combination of the values listed in ``{param: [values]}``."""
+    keys = list(grid)
+    return [dict(zip(keys, values)) for values in itertools.product(*(grid[k] for k in keys))]
+
+
+def sample_params(space: dict, n: int, seed: int = 0) -> list:
+    """Draw n random parameter sets.
+
+    A ``(low, high)`` tuple is sampled uniformly (as an int if both bounds
+    are ints); a list is sampled by choice.
+    """
+    rng = random.Random(seed)
+    samples = []
+    for _ in range(n):
+        params = {}
+        for key, spec in space.items():
+            if isinstance(spec, tuple):
+                low, high = spec
+                if isinstance(low, int) and isinstance(high, int):
+                    params[key] = rng.randint(low, high)
+                else:
+                    params[key] = rng.uniform(low, high)
+            else:
+                params[key] = rng.choice(spec)
+        samples.append(params)
+    return samples
+
+
+def make_jobs(base_config: dict, param_sets: list, out_dir: str, seed: int = 0) -> list:
+    """One headless job per parameter set, each with its own seed and output folders."""
+    jobs = []
+    for i, params in enumerate(param_sets):
+        config = copy.deepcopy(base_config)
+        for key, value in params.items():
+            set_param(config, key, value)
+        job_dir = os.path.join(out_dir, f"job_{i:04d}")
+        config["headless"] = True
+        # Pool workers are daemonic and cannot start a plotting process
+        config["async_plots"] = False
+        config["seed"] = seed + i
+        config["log_dir"] = os.path.join(job_dir, "logs")
+        config["plot_dir"] = os.path.join(job_dir, "plots")
+        jobs.append({"job_id": i, "params": params, "config": config, "dir": job_dir})
+    return jobs
+
+
+def run_job(job: dict) -> list:
+    """Run one job and return a summary row per generation."""
+    rows = []
+
+    def summary_logger(env, gen, config):
+        log_generation(env, gen, config)
+        row = {"job_id": job["job_id"], "seed": config["seed"], **job["params"]}
+        row.update(summarize_generation(env, gen))
+        rows.append(row)
+
+    os.makedirs(job["dir"], exist_ok=True)
+    with open(os.path.join(job["dir"], "stdout.txt"), "w") as out, contextlib.redirect_stdout(out):
+        run_simulation(job["config"], logger_func=summary_logger)
+    return rows
+
+
+def run_sweep(base_config: dict, param_sets: list, out_dir: str, processes: int = None, seed: int = 0) -> list:
+    """Run every parameter set on a process pool and collect one results table.
+
+    The table is also written to ``<out_dir>/results.csv``.
+    """
+    jobs = make_jobs(base_config, param_sets, out_dir, seed)
+    with Pool(processes or os.cpu_count()) as pool:
+        per_job = pool.map(run_job, jobs)
+
+    rows = [row for job_rows in per_job for row in job_rows]
+    write_summary_csv(rows, os.path.join(out_dir, "results.csv"))
+    return rows
+
+
+def _parse_value(text: str):
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        return text
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a grid of headless simulations in parallel.")
+    parser.add_argument("params", nargs="+", help="param=v1,v2,... using dotted config keys")
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default="data/sweeps")
+    args = parser.parse_args()
+
+    grid = {}
+    for spec in args.params:
+        key, _, values = spec.partition("=")
+        grid[key] = [_parse_value(v) for v in values.split(",")]
+
+    rows = run_sweep(CONFIG, expand_grid(grid), args.out, args.processes, args.seed)
+    print(f"{len(rows)} generation rows written to {os.path.join(args.out, 'results.csv')}")
+
+
+if __name__ == "__main__":
+    main()
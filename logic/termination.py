@@ -0,0 +1,82 @@
+from collections import deque
+from logic.scheduler import make_scheduler, run_steps
+
+
+class Termination:
+    """Ends a generation before `time_steps_per_generation` once nothing more can happen.
+
+    Call `start(alive)` at the beginning of a generation and `update(alive)`
+    after every tick with the number of live prey; `update` returns the name
+    of the condition that fired, or None to keep going:
+
+    - ``"all_prey_dead"``: no prey left to catch.
+    - ``"no_capture"``: no capture for `stall_ticks` ticks.
+    - ``"plateau"``: over the last `plateau_window` ticks fewer than
+      `plateau_tolerance` of the live prey were caught, i.e. survival (and so
+      fitness) has stopped separating the prey.
+    """
+
+    def __init__(self, all_prey_dead: bool = True, stall_ticks: int = 0,
+                 plateau_window: int = 0, plateau_tolerance: float = 0.01):
+        self.all_prey_dead = all_prey_dead
+        self.stall_ticks = stall_ticks
+        self.plateau_window = plateau_window
+        self.plateau_tolerance = plateau_tolerance
+        self.start(0)
+
+    def start(self, alive: int):
+        self.tick = 0
+        self.alive = alive
+        self.last_capture = 0
+        self.history = deque([alive], maxlen=self.plateau_window + 1)
+
+    def update(self, alive: int):
+        self.tick += 1
+        if alive < self.alive:
+            self.last_capture = self.tick
+        self.alive = alive
+
+        if self.all_prey_dead and alive == 0:
+            return "all_prey_dead"
+        if self.stall_ticks and self.tick - self.last_capture >= self.stall_ticks:
+            return "no_capture"
+        if self.plateau_window:
+            self.history.append(alive)
+            if len(self.history) > self.plateau_window:
+                oldest = self.history[0]
+                if oldest - alive <= self.plateau_tolerance * oldest:
+                    return "plateau"
+        return None
+
+
+def make_termination(config: dict) -> Termination:
+    settings = config.get("termination", {})
+    return Termination(settings.get("all_prey_dead", True), settings.get("stall_ticks", 0),
+                       settings.get("plateau_window", 0), settings.get("plateau_tolerance", 0.01))
+
+
+def run_ticks(env, steps: int, step_func, render_func, config: dict):
+    """Run one generation's ticks until `steps` or a termination condition.
+
+    Returns the number of ticks run and why the generation ended
+    (``"time_limit"`` when it ran to `steps`).
+    """
+    termination = make_termination(config)
+    termination.start(env.count_alive_prey())
+    reason = None
+
+    def tick():
+        nonlocal reason
+        step_func()
+        reason = termination.update(env.count_alive_prey())
+        return reason is not None
+
+    if render_func is None:
+        ticks = 0
+        while ticks < steps:
+            ticks += 1
+            if tick():
+                break
+    else:
+        ticks = run_steps(steps, tick, render_func, make_scheduler(config), config, env.profiler)
+    return ticks, reason or "time_limit"
@@ -0,0 +1,239 @@
+import argparse
+import copy
+import time
+import numpy as np
+from config import CONFIG
+from core.world_state import AGENT_RADIUS
+from logic.rl import ACTIONS, DIRECTIONS, ArrayQLearningAgent
+from logic.vector_simulation import CAPTURE_REWARD, STEP_PENALTY, WANDER_EPSILON, IDLE_MS
+
+# Unit steering vector per action, in ACTIONS order
+ACTION_VECTORS = np.array([[0, -1], [0, 1], [-1, 0], [1, 0], [0, 0]], np.float32)
+UP, DOWN, LEFT, RIGHT, NONE = (DIRECTIONS.index(d) for d in ("up", "down", "left", "right", "none"))
+
+
+class VecEnv:
+    """B independent predator/prey worlds stepped together in stacked arrays.
+
+    Per-agent arrays are shaped (B, num_prey) or (B, num_predators). Unlike
+    the simulation, predators move by the actions they are given, so a
+    policy can be trained on all worlds at once: `reset()` returns the
+    (B, num_predators) integer states in ArrayQLearningAgent's encoding and
+    `step(actions)` returns next states, rewards and a per-world done flag.
+
+    A world is done once all its prey are caught or after
+    `time_steps_per_generation` ticks. It is reset straight away: the
+    returned next states keep its terminal states for TD targets, while
+    `states` holds the first states of its new episode.
+    """
+
+    def __init__(self, config: dict, n_worlds: int, rng=None, cell_size: int = 50):
+        self.config = config
+        self.n_worlds = n_worlds
+        self.n_prey = config["num_prey"]
+        self.n_predators = config["num_predators"]
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.world_size = config["world_size"]
+        self.tick_ms = config.get("tick_ms", 1000 / 60)
+        self.max_ticks = config["time_steps_per_generation"]
+
+        # Same grid as QLearningAgent, so states index the same Q-table
+        self.cell_size = cell_size
+        self.grid_cols = self.world_size[0] // cell_size
+        self.grid_rows = self.world_size[1] // cell_size
+
+        self.radius = float(AGENT_RADIUS)
+        self.predator_speed = config.get("predator_speed", 4.0)
+
+        prey_shape = (n_worlds, self.n_prey)
+        pred_shape = (n_worlds, self.n_predators)
+        self.prey_x = np.zeros(prey_shape, np.float32)
+        self.prey_y = np.zeros(prey_shape, np.float32)
+        self.prey_vision = np.zeros(prey_shape, np.float32)
+        self.prey_speed = np.zeros(prey_shape, np.float32)
+        self.alive = np.zeros(prey_shape, bool)
+        self.fitness = np.zeros(prey_shape, np.float32)
+        self.target_x = np.zeros(prey_shape, np.float32)
+        self.target_y = np.zeros(prey_shape, np.float32)
+        self.idle_until = np.zeros(prey_shape, np.float64)
+
+        self.pred_x = np.zeros(pred_shape, np.float32)
+        self.pred_y = np.zeros(pred_shape, np.float32)
+        self.total_reward = np.zeros(pred_shape, np.float64)
+
+        self.ticks = np.zeros(n_worlds, np.int64)
+        self.states = np.zeros(pred_shape, np.int64)
+
+    @property
+    def n_states(self) -> int:
+        return self.grid_cols * self.grid_rows * len(DIRECTIONS)
+
+    def reset(self, worlds=None) -> np.ndarray:
+        """Start new episodes in `worlds` (a boolean mask; all by default) and return `states`."""
+        idx = np.arange(self.n_worlds) if worlds is None else np.flatnonzero(worlds)
+        k, n, p = len(idx), self.n_prey, self.n_predators
+        rng, trait_range = self.rng, self.config["trait_range"]
+        center_x, center_y = self.world_size[0] / 2, self.world_size[1] / 2
+
+        self.prey_x[idx] = rng.uniform(center_x - 100, center_x + 100, (k, n))
+        self.prey_y[idx] = rng.uniform(center_y - 100, center_y + 100, (k, n))
+        self.prey_vision[idx] = rng.uniform(*trait_range["vision"], (k, n))
+        self.prey_speed[idx] = rng.uniform(*trait_range["speed"], (k, n))
+        self.alive[idx] = True
+        self.fitness[idx] = 0.0
+        self.target_x[idx] = self.prey_x[idx]
+        self.target_y[idx] = self.prey_y[idx]
+        self.idle_until[idx] = 0.0
+
+        self.pred_x[idx] = rng.uniform(center_x - 200, center_x + 200, (k, p))
+        self.pred_y[idx] = rng.uniform(center_y - 200, center_y + 200, (k, p))
+        self.total_reward[idx] = 0.0
+
+        self.ticks[idx] = 0
+        self.states[idx] = self._encode(idx)
+        return self.states.copy()
+
+    def _encode(self, idx) -> np.ndarray:
+        """Batched `get_state`: grid cell plus direction to the nearest live prey."""
+        px, py = self.pred_x[idx], self.pred_y[idx]
+        col = np.clip((px // self.cell_size).astype(np.int64), 0, self.grid_cols - 1)
+        row = np.clip((py // self.cell_size).astype(np.int64), 0, self.grid_rows - 1)
+
+        alive = self.alive[idx]
+        dx = self.prey_x[idx][:, None, :] - px[:, :, None]
+        dy = self.prey_y[idx][:, None, :] - py[:, :, None]
+        dist = np.where(alive[:, None, :], dx * dx + dy * dy, np.inf)
+        nearest = dist.argmin(axis=2)[..., None]
+        ndx = np.take_along_axis(dx, nearest, axis=2)[..., 0]
+        ndy = np.take_along_axis(dy, nearest, axis=2)[..., 0]
+
+        direction = np.where(np.abs(ndx) > np.abs(ndy),
+                             np.where(ndx > 0, RIGHT, LEFT),
+                             np.where(ndy > 0, DOWN, UP))
+        direction = np.where(alive.any(axis=1)[:, None], direction, NONE)
+        return (row * self.grid_cols + col) * len(DIRECTIONS) + direction
+
+    def step(self, actions):
+        """Advance every world by one tick; returns (next_states, rewards, dones)."""
+        actions = np.asarray(actions)
+        w, h = self.world_size
+        r = self.radius
+        now = (self.ticks * self.tick_ms)[:, None]
+
+        # Predators follow their actions
+        move = ACTION_VECTORS[actions] * self.predator_speed
+        self.pred_x = np.clip(self.pred_x + move[..., 0], r, w - r)
+        self.pred_y = np.clip(self.pred_y + move[..., 1], r, h - r)
+
+        # Captures go to the first predator touching the prey, as in the simulation
+        dx = self.pred_x[:, :, None] - self.prey_x[:, None, :]
+        dy = self.pred_y[:, :, None] - self.prey_y[:, None, :]
+        dist = np.sqrt(dx * dx + dy * dy)
+        touching = (dist < 2 * r) & self.alive[:, None, :]
+        captured = touching.any(axis=1)
+        owner = touching.argmax(axis=1)
+        catches = ((np.arange(self.n_predators)[None, :, None] == owner[:, None, :])
+                   & captured[:, None, :]).sum(axis=2)
+        rewards = catches * CAPTURE_REWARD - STEP_PENALTY
+        self.alive &= ~captured
+        self.total_reward += rewards
+
+        # Live prey flee from the closest visible predator, or wander
+        dist = dist.transpose(0, 2, 1)
+        reach = (self.prey_vision * r + r)[..., None]
+        target = np.where(dist < reach, dist, np.inf).argmin(axis=2)[..., None]
+        target_dist = np.take_along_axis(dist, target, axis=2)[..., 0]
+        fleeing = self.alive & (target_dist < reach[..., 0])
+        away_x = -np.take_along_axis(dx.transpose(0, 2, 1), target, axis=2)[..., 0]
+        away_y = -np.take_along_axis(dy.transpose(0, 2, 1), target, axis=2)[..., 0]
+        safe = np.where(fleeing & (target_dist > 0), target_dist, np.inf)
+        vel_x = away_x / safe * self.prey_speed
+        vel_y = away_y / safe * self.prey_speed
+
+        wander_x, wander_y = self._wander(self.alive & ~fleeing, now)
+        vel_x = np.where(fleeing, vel_x, wander_x)
+        vel_y = np.where(fleeing, vel_y, wander_y)
+
+        self.fitness[self.alive] += 1.0
+        self.prey_x = np.clip(self.prey_x + vel_x, r, w - r)
+        self.prey_y = np.clip(self.prey_y + vel_y, r, h - r)
+
+        self.ticks += 1
+        next_states = self._encode(np.arange(self.n_worlds))
+        dones = ~self.alive.any(axis=1) | (self.ticks >= self.max_ticks)
+        self.states = next_states.copy()
+        if dones.any():
+            self.reset(dones)
+        return next_states, rewards, dones
+
+    def _wander(self, mask, now):
+        """Batched wander mode for the prey in `mask`; returns their velocities."""
+        dx = self.target_x - self.prey_x
+        dy = self.target_y - self.prey_y
+        dist = np.sqrt(dx * dx + dy * dy)
+        arrived = mask & (dist < WANDER_EPSILON)
+        idle = mask & ~arrived & (now < self.idle_until)
+        moving = mask & ~arrived & ~idle
+
+        if arrived.any():
+            range_ = self.prey_vision[arrived] * self.radius
+            x, y = self.prey_x[arrived], self.prey_y[arrived]
+            w, h = self.world_size
+            new_x = self.rng.uniform(x - range_, x + range_ * 2)
+            new_y = self.rng.uniform(y - range_ * 2, y + range_ * 2)
+            self.target_x[arrived] = np.clip(new_x, self.radius, w - self.radius)
+            self.target_y[arrived] = np.clip(new_y, self.radius, h - self.radius)
+            self.idle_until[arrived] = np.broadcast_to(now, arrived.shape)[arrived] + IDLE_MS
+
+        safe = np.where(moving, dist, np.inf)
+        return dx / safe * self.prey_speed, dy / safe * self.prey_speed
+
+
+def train_predators(env: VecEnv, learner: ArrayQLearningAgent, ticks: int, rng=None) -> np.ndarray:
+    """Train one shared learner on every predator of every world for `ticks` ticks.
+
+    Returns the mean predator reward of each tick.
+    """
+    if not isinstance(learner, ArrayQLearningAgent):
+        raise ValueError("VecEnv states are table indices; train an ArrayQLearningAgent")
+    if (learner.grid_cols, learner.grid_rows) != (env.grid_cols, env.grid_rows):
+        raise ValueError("Learner and environment use different state grids")
+    rng = rng if rng is not None else env.rng
+    history = np.zeros(ticks)
+    states = env.reset()
+    for t in range(ticks):
+        actions = learner.choose_actions(states, rng)
+        next_states, rewards, _ = env.step(actions)
+        learner.update_arrays(states, actions, rewards, next_states)
+        history[t] = rewards.mean()
+        states = env.states
+    return history
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train a predator Q-table on many worlds at once.")
+    parser.add_argument("--worlds", type=int, default=64)
+    parser.add_argument("--ticks", type=int, default=3000)
+    parser.add_argument("--out", default="data/q_table.json")
+    parser.add_argument("--seed", type=int, default=CONFIG["seed"])
+    args = parser.parse_args()
+
+    config = copy.deepcopy(CONFIG)
+    rl_cfg = config["rl"]
+    rng = np.random.default_rng(args.seed)
+    env = VecEnv(config, args.worlds, rng)
+    learner = ArrayQLearningAgent(ACTIONS, rl_cfg["learning_rate"], rl_cfg["discount_factor"],
+                                  rl_cfg["epsilon"], config)
+
+    start = time.perf_counter()
+    history = train_predators(env, learner, args.ticks)
+    elapsed = time.perf_counter() - start
+    transitions = args.ticks * args.worlds * env.n_predators
+    print(f"{transitions} transitions in {elapsed:.2f}s ({transitions / elapsed:.0f}/s), "
+          f"mean reward over the last 10% of ticks {history[-max(1, args.ticks // 10):].mean():.4f}")
+    learner.save_to_file(args.out)
+    print(f"Q-table saved to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,286 @@
+import random
+import numpy as np
+from core.world_state import WorldState, VectorEnvironment
+from logic.evolution import evolve_genomes, random_genomes
+from logic.rl import ACTIONS, build_q_agent, build_shared_learner
+from analysis.profiler import make_profiler
+from logic.simulation import finish_generation, make_clusterer
+from analysis.plot_worker import make_plotter
+from logic.termination import run_ticks
+from logic.checkpoint import maybe_checkpoint
+
+WANDER_EPSILON = 5.0
+IDLE_MS = 2000.0
+CAPTURE_REWARD = 5.0
+STEP_PENALTY = 0.001
+
+
+def _pairwise(ax, ay, bx, by):
+    """Offsets (b - a) and distances between every a (rows) and b (columns)."""
+    dx = bx[None, :] - ax[:, None]
+    dy = by[None, :] - ay[:, None]
+    return dx, dy, np.sqrt(dx * dx + dy * dy)
+
+
+def _spawn_prey(state, config, rng, rows):
+    n = len(rows)
+    state.vision[rows] = rng.uniform(*config["trait_range"]["vision"], n)
+    state.speed[rows] = rng.uniform(*config["trait_range"]["speed"], n)
+    state.traits[rows] = random_genomes(config, rng, n)
+
+
+def build_world(config: dict, rng, clock) -> VectorEnvironment:
+    n_prey, n_pred = config["num_prey"], config["num_predators"]
+    state = WorldState(n_prey, n_pred)
+    center_x, center_y = config["world_size"][0] / 2, config["world_size"][1] / 2
+
+    prey = state.prey
+    state.x[prey] = rng.uniform(center_x - 100, center_x + 100, n_prey)
+    state.y[prey] = rng.uniform(center_y - 100, center_y + 100, n_prey)
+    _spawn_prey(state, config, rng, np.arange(n_prey))
+
+    pred = state.predators
+    state.x[pred] = rng.uniform(center_x - 200, center_x + 200, n_pred)
+    state.y[pred] = rng.uniform(center_y - 200, center_y + 200, n_pred)
+    state.speed[pred] = config.get("predator_speed", 4.0)
+    state.vision[pred] = config.get("predator_vision", 20.0)
+
+    state.target_x[:] = state.x
+    state.target_y[:] = state.y
+
+    shared = build_shared_learner(config)
+    if shared is not None:
+        learners = [shared] * n_pred
+    else:
+        learners = [build_q_agent(ACTIONS, config) for _ in range(n_pred)]
+    env = VectorEnvironment(config, state, learners, clock)
+    env.shared_learner = shared
+    return env
+
+
+def _wander(state, rows, now, rng, world_size):
+    """Batched version of the agents' wander mode for the given rows."""
+    dx = state.target_x[rows] - state.x[rows]
+    dy = state.target_y[rows] - state.y[rows]
+    dist = np.sqrt(dx * dx + dy * dy)
+
+    arrived = dist < WANDER_EPSILON
+    idle = ~arrived & (now < state.idle_until[rows])
+    moving = ~arrived & ~idle
+
+    hit = rows[arrived]
+    if len(hit):
+        radius = state.radius[hit]
+        range_ = state.vision[hit] * radius
+        x, y = state.x[hit], state.y[hit]
+        new_x = rng.uniform(x - range_, x + range_ * 2)
+        new_y = rng.uniform(y - range_ * 2, y + range_ * 2)
+        state.target_x[hit] = np.clip(new_x, radius, world_size[0] - radius)
+        state.target_y[hit] = np.clip(new_y, radius, world_size[1] - radius)
+        state.idle_until[hit] = now + IDLE_MS
+
+    speed = state.speed[rows]
+    safe = np.where(moving, dist, 1.0)
+    state.vel_x[rows] = np.where(moving, dx / safe * speed, 0.0)
+    state.vel_y[rows] = np.where(moving, dy / safe * speed, 0.0)
+
+
+def _steer(state, rows, has_target, dx, dy, dist, now, rng, world_size):
+    """Move `rows` along (dx, dy) when they see a target, wander otherwise."""
+    speed = state.speed[rows]
+    nonzero = has_target & (dist > 0)
+    safe = np.where(nonzero, dist, 1.0)
+    state.vel_x[rows] = np.where(nonzero, dx / safe * speed, 0.0)
+    state.vel_y[rows] = np.where(nonzero, dy / safe * speed, 0.0)
+    if not has_target.all():
+        _wander(state, rows[~has_target], now, rng, world_size)
+
+
+def _integrate(state, rows, world_size):
+    radius = state.radius[rows]
+    state.x[rows] = np.clip(state.x[rows] + state.vel_x[rows], radius, world_size[0] - radius)
+    state.y[rows] = np.clip(state.y[rows] + state.vel_y[rows], radius, world_size[1] - radius)
+
+
+def _nearest_offsets(state, pred_rows, prey_rows):
+    """Offset (dx, dy) from each predator to its nearest live prey, or None."""
+    if len(prey_rows) == 0:
+        return [None] * len(pred_rows)
+    dx, dy, dist = _pairwise(state.x[pred_rows], state.y[pred_rows],
+                             state.x[prey_rows], state.y[prey_rows])
+    nearest = dist.argmin(axis=1)
+    rows = np.arange(len(pred_rows))
+    return list(zip(dx[rows, nearest].tolist(), dy[rows, nearest].tolist()))
+
+
+def encode_states(env: VectorEnvironment):
+    state = env.state
+    pred_rows = np.arange(state.n_prey, state.n_prey + state.n_predators)
+    prey_rows = np.flatnonzero(state.alive[state.prey])
+    offsets = _nearest_offsets(state, pred_rows, prey_rows)
+    return [learner.state_at(float(state.x[row]), float(state.y[row]), offset)
+            for learner, row, offset in zip(env.learners, pred_rows, offsets)]
+
+
+def _move_predators(env: VectorEnvironment, now: float, rng):
+    """Predators chase the closest visible live prey, or wander."""
+    state = env.state
+    world_size = env.config["world_size"]
+    pred_rows = np.arange(state.n_prey, state.n_prey + state.n_predators)
+    prey_rows = np.arange(state.n_prey)
+
+    dx, dy, dist = _pairwise(state.x[pred_rows], state.y[pred_rows], state.x[prey_rows], state.y[prey_rows])
+    reach = (state.vision[pred_rows] * state.radius[pred_rows])[:, None] + state.radius[prey_rows][None, :]
+    visible = (dist < reach) & state.alive[prey_rows][None, :]
+    target = np.where(visible, dist, np.inf).argmin(axis=1)
+    k = np.arange(len(pred_rows))
+    _steer(state, pred_rows, visible.any(axis=1),
+           dx[k, target], dy[k, target], dist[k, target], now, rng, world_size)
+    _integrate(state, pred_rows, world_size)
+
+
+def _capture_and_learn(env: VectorEnvironment):
+    """Resolve captures in predator order and apply each predator's Q update."""
+    state = env.state
+    pred_rows = np.arange(state.n_prey, state.n_prey + state.n_predators)
+    prey_rows = np.arange(state.n_prey)
+
+    _, _, dist = _pairwise(state.x[pred_rows], state.y[pred_rows], state.x[prey_rows], state.y[prey_rows])
+    touching = (dist < state.radius[pred_rows][:, None] + state.radius[prey_rows][None, :]) & state.alive[prey_rows][None, :]
+    captured = touching.any(axis=0)
+    owners = touching.argmax(axis=0)[captured]
+    rewards = np.bincount(owners, minlength=len(pred_rows)) * CAPTURE_REWARD - STEP_PENALTY
+    state.alive[prey_rows[captured]] = False
+
+    next_states = encode_states(env)
+    for i, learner in enumerate(env.learners):
+        if env.last_states[i] is not None and env.last_actions[i] is not None:
+            learner.update_q(env.last_states[i], env.last_actions[i], float(rewards[i]), next_states[i])
+        env.last_states[i] = next_states[i]
+    if env.shared_learner is not None:
+        env.shared_learner.flush()
+    state.total_reward[pred_rows] += rewards
+
+
+def _move_prey(env: VectorEnvironment, now: float, rng):
+    """Live prey flee from the closest visible predator, or wander."""
+    state = env.state
+    world_size = env.config["world_size"]
+    pred_rows = np.arange(state.n_prey, state.n_prey + state.n_predators)
+
+    live = np.flatnonzero(state.alive[state.prey])
+    if len(live) == 0:
+        return
+    dx, dy, dist = _pairwise(state.x[live], state.y[live], state.x[pred_rows], state.y[pred_rows])
+    reach = (state.vision[live] * state.radius[live])[:, None] + state.radius[pred_rows][None, :]
+    visible = (dist < reach) & state.alive[pred_rows][None, :]
+    target = np.where(visible, dist, np.inf).argmin(axis=1)
+    r = np.arange(len(live))
+    _steer(state, live, visible.any(axis=1),
+           -dx[r, target], -dy[r, target], dist[r, target], now, rng, world_size)
+    state.fitness[live] += 1.0
+    _integrate(state, live, world_size)
+
+
+def step_world(env: VectorEnvironment, now: float, rng):
+    """Advance every agent in the world by one tick.
+
+    Mirrors the per-agent loop of `run_simulation`: predators steer, move and
+    capture, then live prey steer and move. Captures are resolved in
+    predator order, so a prey touched by two predators rewards the first.
+    """
+    profiler = env.profiler
+    with profiler.phase("predator_move"):
+        _move_predators(env, now, rng)
+    with profiler.phase("predator_learn"):
+        _capture_and_learn(env)
+    with profiler.phase("prey"):
+        _move_prey(env, now, rng)
+    profiler.step()
+
+
+def next_generation(env: VectorEnvironment, rng):
+    """Build the next generation's WorldState from the current survivors."""
+    config = env.config
+    old = env.state
+    survivors = np.flatnonzero(old.alive[old.prey])
+    n_children = min(len(survivors), config["num_prey"])
+    children, parents = evolve_genomes(old.traits[survivors], old.fitness[survivors], n_children, config, rng)
+    parents = survivors[parents]
+
+    state = WorldState(config["num_prey"], old.n_predators)
+    pred_old, pred_new = old.predators, state.predators
+    for name in ("x", "y", "vel_x", "vel_y", "radius", "vision", "speed", "alive",
+                 "fitness", "total_reward", "target_x", "target_y", "idle_until"):
+        getattr(state, name)[pred_new] = getattr(old, name)[pred_old]
+
+    w, h = config["world_size"]
+    kids = np.arange(n_children)
+    state.traits[kids] = children
+    state.vision[kids] = old.vision[parents]
+    state.speed[kids] = old.speed[parents]
+    state.x[kids] = rng.uniform(0, w, n_children)
+    state.y[kids] = rng.uniform(0, h, n_children)
+
+    fresh = np.arange(n_children, state.n_prey)
+    _spawn_prey(state, config, rng, fresh)
+    state.x[fresh] = rng.uniform(0, w, len(fresh))
+    state.y[fresh] = rng.uniform(0, h, len(fresh))
+
+    prey = state.prey
+    state.target_x[prey] = state.x[prey]
+    state.target_y[prey] = state.y[prey]
+    env.set_state(state)
+
+
+def generation_summary(env: VectorEnvironment) -> dict:
+    state = env.state
+    alive = state.alive[state.prey]
+    survivors = int(alive.sum())
+    return {
+        "survivors": survivors,
+        "avg_survivor_fitness": float(state.fitness[state.prey][alive].mean()) if survivors else 0.0,
+    }
+
+
+def run_vectorized_simulation(config: dict, logger_func, visualization_func, clock, resume: dict = None):
+    """Struct-of-arrays counterpart of `run_simulation` for large populations."""
+    if resume is None:
+        rng = np.random.default_rng(random.getrandbits(32))
+        env = build_world(config, rng, clock)
+        env.clusterer = make_clusterer(config)
+        start = 0
+    else:
+        env, rng, start = resume["env"], resume["rng"], resume["generation"]
+        clock = env.clock
+    env.profiler = make_profiler(config)
+    env.plotter = make_plotter(config)
+
+    try:
+        for gen in range(start, config["num_generations"]):
+            print(f"=== Generation {gen+1} ===")
+            env.reset_generation()
+
+            env.last_states = encode_states(env)
+            env.last_actions = [random.choice(learner.actions) for learner in env.learners]
+            env.state.total_reward[env.state.predators] = 0.0
+
+            env.profiler.start_steps()
+
+            def tick():
+                step_world(env, clock.get_ticks(), rng)
+                clock.tick()
+
+            render = None if visualization_func is None else lambda step: visualization_func(env, gen, step)
+            ticks, reason = run_ticks(env, config["time_steps_per_generation"], tick, render, config)
+
+            env.generation_stats = generation_summary(env)
+            env.generation_stats.update(ticks=ticks, terminated_by=reason)
+            with env.profiler.phase("evolution"):
+                next_generation(env, rng)
+            finish_generation(env, gen, config, logger_func)
+            maybe_checkpoint(env, gen, config, rng)
+    finally:
+        env.plotter.close()
+
+    print("Simulation completed.")
@@ -1,12 +1,33 @@
-import pygame
 import sys
 from logic.simulation import run_simulation, debug_simulation
 from config import CONFIG
 from analysis.logger import log_generation, dummy_logger
-from analysis.visualization import plot_reward_curve, plot_trait_distribution
-from ui.pygame_view import render
+from analysis.visualization import plot_reward_curve
+
+def run_headless(resume_from=None):
+    """Run every generation as fast as possible without pygame or a display."""
+    def headless_logger(env, gen, config):
+        log_generation(env, gen, config)
+        dummy_logger(env, gen, config)
+
+    run_simulation(CONFIG, logger_func=headless_logger, resume_from=resume_from)
+
+def run_in_process(resume_from=None):
+    """Run the engine in a worker process and draw it from shared-memory snapshots."""
+    from logic.sim_process import SimProcess
+    from ui.pygame_view import render_process
+
+    sim = SimProcess(CONFIG, resume_from=resume_from)
+    try:
+        render_process(sim)
+    except KeyboardInterrupt:
+        print("\nSimulation interrupted by user")
+        sim.stop()
+
+def main(resume_from=None):
+    import pygame
+    from ui.pygame_view import render
 
-def main():
     pygame.init()
     
     # Get screen info for optimal sizing
@@ -29,20 +50,29 @@ def main():
     clock = pygame.time.Clock()
     reward_history = []
 
+    if CONFIG.get("sim_process", False):
+        run_in_process(resume_from)
+        show_completion(screen, width, height)
+        return
+
     def custom_logger(env, gen, config):
         log_generation(env, gen, config)
         if env.predators:
             avg_reward = sum(pr.total_reward for pr in env.predators) / len(env.predators)
             reward_history.append(avg_reward)
         prey_data = [{"traits": p.traits} for p in env.prey]
-        plot_trait_distribution(prey_data, gen, config)
+        env.plotter.submit("trait_distribution", prey_data, gen, config)
 
     try:
-        run_simulation(CONFIG, logger_func=custom_logger, visualization_func=render)
+        run_simulation(CONFIG, logger_func=custom_logger, visualization_func=render, resume_from=resume_from)
     except KeyboardInterrupt:
         print("\nSimulation interrupted by user")
     
     plot_reward_curve(reward_history, CONFIG)
+    show_completion(screen, width, height)
+
+def show_completion(screen, width, height):
+    import pygame
 
     # Show completion message
     font = pygame.font.Font(None, 48)
@@ -64,4 +94,9 @@ def main():
     sys.exit()
 
 if __name__ == "__main__":
-    main()
+    args = sys.argv[1:]
+    resume_from = args[args.index("--resume") + 1] if "--resume" in args else None
+    if "--headless" in args:
+        run_headless(resume_from)
+    else:
+        main(resume_from)
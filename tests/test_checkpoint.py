@@ -0,0 +1,68 @@
+import copy
+import filecmp
+import random
+import pytest
+from config import CONFIG
+from core.clock import SimClock
+from analysis.logger import log_generation
+from logic.checkpoint import load_checkpoint, resume_state, save_checkpoint
+from logic.simulation import populate_environment, run_generation, next_generation, run_simulation
+
+
+def make_config(tmp_path, name: str, **overrides) -> dict:
+    config = copy.deepcopy(CONFIG)
+    config.update(seed=11, num_generations=4, time_steps_per_generation=80, async_plots=False,
+                  log_dir=str(tmp_path / name), plot_dir=str(tmp_path / "plots"),
+                  checkpoint_dir=str(tmp_path / "checkpoints"))
+    config.update(overrides)
+    return config
+
+
+def agent_state(env) -> list:
+    return [(a.entity_class, a.x, a.y, a.vel_x, a.vel_y, a.speed, a.vision, a.alive, a.fitness,
+             a.total_reward, getattr(a, "traits", None)) for a in env.agents]
+
+
+def test_checkpoint_round_trip_restores_state(tmp_path):
+    config = make_config(tmp_path, "roundtrip")
+    random.seed(config["seed"])
+    env = populate_environment(config, SimClock())
+    run_generation(env, 0, config)
+    next_generation(env, config)
+
+    path = str(tmp_path / "state.ckpt")
+    save_checkpoint(path, env, 1)
+    expected_random = random.getstate()
+    random.random()
+
+    payload = resume_state(path, config)
+    restored = payload["env"]
+    assert payload["generation"] == 1
+    assert random.getstate() == expected_random
+    assert agent_state(restored) == agent_state(env)
+    assert [pr.rl_agent.q_table for pr in restored.predators] == [pr.rl_agent.q_table for pr in env.predators]
+    assert restored.clock.get_ticks() == env.clock.get_ticks()
+    # Agents must point at the restored world, not at copies of it
+    assert all(a.environment is restored for a in restored.agents)
+
+
+def test_load_rejects_other_files(tmp_path):
+    path = tmp_path / "not_a_checkpoint"
+    path.write_bytes(b"hello")
+    with pytest.raises(ValueError):
+        load_checkpoint(str(path))
+
+
+@pytest.mark.parametrize("engine,learner", [("agents", "dict"), ("agents", "array"), ("vectorized", "array")])
+def test_resumed_run_logs_match_uninterrupted_run(tmp_path, engine, learner):
+    full = make_config(tmp_path, "full", engine=engine, checkpoint_interval=2)
+    full["rl"]["learner"] = learner
+    run_simulation(full, log_generation)
+
+    resumed = make_config(tmp_path, "resumed", engine=engine)
+    resumed["rl"]["learner"] = learner
+    run_simulation(resumed, log_generation, resume_from=str(tmp_path / "checkpoints" / "gen_2.ckpt"))
+
+    for gen in (3, 4):
+        assert filecmp.cmp(tmp_path / "full" / f"gen_{gen}.json", tmp_path / "resumed" / f"gen_{gen}.json",
+                           shallow=False)
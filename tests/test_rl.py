@@ -0,0 +1,47 @@
+import copy
+import pytest
+from config import CONFIG
+from logic.rl import ACTIONS, LEARNERS, SharedQLearner
+
+
+def make_learner(name: str):
+    config = copy.deepcopy(CONFIG)
+    config["rl"]["learner"] = name
+    rl = config["rl"]
+    return LEARNERS[name](ACTIONS, rl["learning_rate"], rl["discount_factor"], rl["epsilon"], config)
+
+
+def q_values(learner, state) -> dict:
+    # Both learners expose the string-keyed table; unseen states read as zeros
+    key = learner.decode_state(state) if hasattr(learner, "decode_state") else state
+    return learner.q_table.get(key, {a: 0.0 for a in ACTIONS})
+
+
+@pytest.mark.parametrize("name", ["dict", "array"])
+def test_same_cell_updates_are_averaged(name):
+    learner = make_learner(name)
+    shared = SharedQLearner(learner)
+    s = learner.encode_state(2, 3, "left")
+    s2 = learner.encode_state(4, 1, "up")
+    learner.update_q(s2, "up", 10.0, s2)  # give the next state a value
+    max_next = max(q_values(learner, s2).values())
+
+    shared.update_q(s, "left", 1.0, s2)
+    shared.update_q(s, "left", 3.0, s2)
+    assert q_values(learner, s)["left"] == 0.0  # queued until flush
+    shared.flush()
+
+    target = (1.0 + 3.0) / 2 + learner.gamma * max_next
+    assert q_values(learner, s)["left"] == pytest.approx(learner.alpha * target)
+    assert shared.pending == []
+
+
+@pytest.mark.parametrize("name", ["dict", "array"])
+def test_batch_targets_ignore_transition_order(name):
+    a, b = make_learner(name), make_learner(name)
+    s1 = a.encode_state(0, 0, "right")
+    s2 = a.encode_state(1, 0, "down")
+    batch = [(s1, "right", 5.0, s2), (s2, "down", 1.0, s1), (s1, "stay", -1.0, s1)]
+    a.update_batch(batch)
+    b.update_batch(list(reversed(batch)))
+    assert a.q_table == b.q_table
@@ -0,0 +1,86 @@
+import copy
+import math
+import random
+import pytest
+from config import CONFIG
+from core.clock import SimClock
+from logic.simulation import populate_environment, step_environment
+
+
+def make_env(seed: int, num_prey: int = 150, num_predators: int = 15):
+    config = copy.deepcopy(CONFIG)
+    config.update(num_prey=num_prey, num_predators=num_predators, world_size=(400, 300), async_plots=False)
+    random.seed(seed)
+    env = populate_environment(config, SimClock())
+    # Spread agents out so queries cross cell borders in every direction
+    for agent in env.agents:
+        agent.x = random.uniform(agent.radius, 400 - agent.radius)
+        agent.y = random.uniform(agent.radius, 300 - agent.radius)
+    env.rebuild_index()
+    return env
+
+
+def brute_collisions(env, agent):
+    return [o for o in env.agents if o is not agent and o.alive and o.entity_class != agent.entity_class
+            and math.hypot(agent.x - o.x, agent.y - o.y) < agent.radius + o.radius]
+
+
+def brute_sight(env, agent):
+    return [o for o in env.agents if o is not agent and o.alive
+            and math.hypot(agent.x - o.x, agent.y - o.y) < agent.vision * agent.radius + o.radius]
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_listeners_match_brute_force(seed):
+    env = make_env(seed)
+    collided = 0
+    for _ in range(5):
+        for agent in env.agents:
+            if not agent.alive:
+                continue
+            assert env.collisionListener(agent) == brute_collisions(env, agent)
+            assert env.sightListener(agent) == brute_sight(env, agent)
+            collided += len(env.collisionListener(agent))
+        step_environment(env)
+    assert collided > 0
+
+
+def test_listeners_follow_moves_and_removals():
+    env = make_env(3)
+    mover = env.prey[0]
+    mover.x, mover.y = 390.0, 290.0
+    env.move_agent(mover)
+    env.kill(env.prey[1])
+    env.remove_dead_agents()
+    for agent in env.agents:
+        if agent.alive:
+            assert env.sightListener(agent) == brute_sight(env, agent)
+
+
+def brute_nearest_prey(env, x, y):
+    best, best_dist = None, float("inf")
+    for p in env.prey:
+        if p.alive:
+            dist = math.hypot(p.x - x, p.y - y)
+            if dist < best_dist:
+                best, best_dist = p, dist
+    return best
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_nearest_prey_matches_brute_force(seed):
+    env = make_env(seed, num_prey=60, num_predators=20)
+    for _ in range(30):
+        step_environment(env)
+        for predator in env.predators:
+            assert env.nearest_prey(predator) is brute_nearest_prey(env, predator.x, predator.y)
+
+
+def test_nearest_prey_requeries_caught_prey():
+    env = make_env(4, num_prey=40)
+    predator = env.predators[0]
+    for _ in range(len(env.prey)):
+        prey = env.nearest_prey(predator)
+        assert prey is not None and prey is brute_nearest_prey(env, predator.x, predator.y)
+        env.kill(prey)
+    assert env.nearest_prey(predator) is None
@@ -1,6 +1,7 @@
 import pygame
 import math
 from ui.ui_controller import UIController
+from ui.sprite_cache import sprites
 
 # Color scheme
 DARK_BG = (25, 25, 35)
@@ -14,6 +15,10 @@ class ScreenRenderer:
         self.config = config
         self.ui_controller = UIController(config)
         self.sidebar_width = 300
+        self.sprites = sprites
+        self.reward_font = pygame.font.Font(None, 14)
+        self._background = None
+        self._background_key = None
         
         # Performance tracking
         self.fitness_history = []
@@ -53,12 +58,19 @@ class ScreenRenderer:
         return not self.ui_controller.is_paused
     
     def _draw_simulation_area(self, screen, env):
-        """Draw the main simulation area"""
-        sim_rect = pygame.Rect(
-            self.sidebar_width, 0,
-            screen.get_width() - self.sidebar_width,
-            screen.get_height()
-        )
+        """Draw the main simulation area from a cached background layer"""
+        key = (screen.get_size(), self.sidebar_width)
+        if key != self._background_key:
+            self._background = self._build_background(
+                screen.get_width() - self.sidebar_width, screen.get_height())
+            self._background_key = key
+        screen.blit(self._background, (self.sidebar_width, 0))
+    
+    def _build_background(self, width, height):
+        """Compose the static gradient, grid and border once per window size"""
+        background = pygame.Surface((max(width, 0), height))
+        background.fill(DARK_BG)
+        sim_rect = background.get_rect()
         
         # Simple gradient background - FIXED COLOR CALCULATION
         for y in range(0, sim_rect.height, 2):
@@ -71,7 +83,7 @@ class ScreenRenderer:
             b = max(245, min(255, base_color + variation + 6))
             
             color = (r, g, b)
-            pygame.draw.line(screen, color, 
+            pygame.draw.line(background, color, 
                            (sim_rect.x, sim_rect.y + y), 
                            (sim_rect.right, sim_rect.y + y))
         
@@ -79,12 +91,13 @@ class ScreenRenderer:
         grid_size = 50
         grid_color = (220, 225, 230)
         for x in range(sim_rect.x, sim_rect.right, grid_size):
-            pygame.draw.line(screen, grid_color, (x, sim_rect.y), (x, sim_rect.bottom), 1)
+            pygame.draw.line(background, grid_color, (x, sim_rect.y), (x, sim_rect.bottom), 1)
         for y in range(sim_rect.y, sim_rect.bottom, grid_size):
-            pygame.draw.line(screen, grid_color, (sim_rect.x, y), (sim_rect.right, y), 1)
+            pygame.draw.line(background, grid_color, (sim_rect.x, y), (sim_rect.right, y), 1)
         
         # Border
-        pygame.draw.rect(screen, (150, 150, 160), sim_rect, 2)
+        pygame.draw.rect(background, (150, 150, 160), sim_rect, 2)
+        return background
     
     def _draw_agents(self, screen, env):
         """Draw agents with modern styling"""
@@ -106,28 +119,16 @@ class ScreenRenderer:
                 if vision is None:
                     vision = 3.0  # Default value
                     
-                vision_radius = int(vision * agent.radius)
+                vision_surf = self.sprites.vision(agent.entity_class, agent.radius, vision)
+                vision_radius = vision_surf.get_width() // 2
                 if vision_radius > 0:
-                    vision_surf = pygame.Surface((vision_radius * 2, vision_radius * 2), pygame.SRCALPHA)
-                    
-                    if agent.entity_class == "prey":
-                        color = (100, 150, 255, 30)
-                    else:
-                        color = (255, 100, 100, 40)
-                    
-                    pygame.draw.circle(vision_surf, color, (vision_radius, vision_radius), vision_radius)
                     screen.blit(vision_surf, (int(x - vision_radius), int(y - vision_radius)))
             
-            # Draw agent with glow effect
+            # Agent with glow effect, pre-rendered per class and radius
+            body = self.sprites.body(agent.entity_class, agent.radius)
+            screen.blit(body, (int(x - agent.radius * 2), int(y - agent.radius * 2)))
+            
             if agent.entity_class == "prey":
-                # Prey with blue glow
-                glow_surf = pygame.Surface((agent.radius * 4, agent.radius * 4), pygame.SRCALPHA)
-                pygame.draw.circle(glow_surf, (0, 120, 255, 50), (agent.radius * 2, agent.radius * 2), agent.radius * 2)
-                screen.blit(glow_surf, (int(x - agent.radius * 2), int(y - agent.radius * 2)))
-                
-                pygame.draw.circle(screen, (0, 120, 255), (int(x), int(y)), agent.radius)
-                pygame.draw.circle(screen, (100, 180, 255), (int(x), int(y)), agent.radius, 2)
-                
                 # Fitness indicator
                 if hasattr(agent, 'fitness') and agent.fitness > 0:
                     fitness_bar_width = int(min(30, agent.fitness / 10))
@@ -136,20 +137,11 @@ class ScreenRenderer:
                         pygame.draw.rect(screen, (100, 255, 100), bar_rect)
                 
             else:  # Predator
-                # Predator with red glow
-                glow_surf = pygame.Surface((agent.radius * 4, agent.radius * 4), pygame.SRCALPHA)
-                pygame.draw.circle(glow_surf, (255, 60, 60, 70), (agent.radius * 2, agent.radius * 2), agent.radius * 2)
-                screen.blit(glow_surf, (int(x - agent.radius * 2), int(y - agent.radius * 2)))
-                
-                pygame.draw.circle(screen, (255, 60, 60), (int(x), int(y)), agent.radius)
-                pygame.draw.circle(screen, (255, 120, 120), (int(x), int(y)), agent.radius, 2)
-                
                 # Reward indicator
                 if hasattr(agent, 'total_reward'):
                     reward_color = (100, 255, 100) if agent.total_reward > 0 else (255, 100, 100)
                     reward_text = f"{agent.total_reward:.1f}"
-                    font = pygame.font.Font(None, 14)
-                    text_surf = font.render(reward_text, True, reward_color)
+                    text_surf = self.reward_font.render(reward_text, True, reward_color)
                     screen.blit(text_surf, (int(x + agent.radius + 5), int(y - agent.radius)))
             
             # Draw velocity vector
@@ -269,4 +261,41 @@ def render(env, gen, step):
         
         renderer.handle_event(event)
     
-    return renderer.render(env, gen, step, screen)
\ No newline at end of file
+    return renderer.render(env, gen, step, screen)
+
+
+def render_process(sim):
+    """Draw a SimProcess from its shared-memory snapshots until the engine finishes.
+
+    The window keeps handling input at `target_fps` even while the engine
+    is busy with a generation boundary.
+    """
+    global renderer
+
+    if renderer is None:
+        renderer = ScreenRenderer(sim.config)
+    controller = renderer.ui_controller
+    paused = controller.is_paused
+    clock = pygame.time.Clock()
+
+    while sim.running:
+        screen = pygame.display.get_surface()
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                sim.stop()
+                pygame.quit()
+                exit()
+
+            renderer.handle_event(event)
+
+        if controller.is_paused != paused:
+            paused = controller.is_paused
+            sim.set_paused(paused)
+        sim.sync_config()
+
+        env = sim.snapshot()
+        if env is not None:
+            renderer.render(env, sim.gen, sim.step, screen)
+        clock.tick(sim.config.get("target_fps", 60))
+
+    sim.stop()
@@ -0,0 +1,65 @@
+import pygame
+from collections import OrderedDict
+
+PREY_VISION = (100, 150, 255, 30)
+PREDATOR_VISION = (255, 100, 100, 40)
+PREY_STYLE = ((0, 120, 255, 50), (0, 120, 255), (100, 180, 255))
+PREDATOR_STYLE = ((255, 60, 60, 70), (255, 60, 60), (255, 120, 120))
+
+
+class SpriteCache:
+    """Pre-rendered agent surfaces, built once per key and reused every frame.
+
+    Vision radii are rounded to `quantum` pixels so evolving traits map onto
+    a bounded set of circles; once more than `max_sprites` distinct sprites
+    exist, the least recently drawn ones are dropped.
+    """
+
+    def __init__(self, max_sprites: int = 256, quantum: int = 2):
+        self.max_sprites = max_sprites
+        self.quantum = max(1, quantum)
+        self._sprites = OrderedDict()
+
+    def __len__(self):
+        return len(self._sprites)
+
+    def _get(self, key, build):
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = self._sprites[key] = build()
+            if len(self._sprites) > self.max_sprites:
+                self._sprites.popitem(last=False)
+        else:
+            self._sprites.move_to_end(key)
+        return sprite
+
+    def quantize(self, radius_px: float) -> int:
+        return int(round(radius_px / self.quantum)) * self.quantum
+
+    def circle(self, radius_px: int, color: tuple) -> pygame.Surface:
+        """Filled (usually translucent) circle of the given pixel radius."""
+        def build():
+            surf = pygame.Surface((radius_px * 2, radius_px * 2), pygame.SRCALPHA)
+            pygame.draw.circle(surf, color, (radius_px, radius_px), radius_px)
+            return surf
+        return self._get(("circle", radius_px, color), build)
+
+    def vision(self, entity_class: str, radius: int, vision: float) -> pygame.Surface:
+        color = PREY_VISION if entity_class == "prey" else PREDATOR_VISION
+        return self.circle(self.quantize(vision * radius), color)
+
+    def body(self, entity_class: str, radius: int) -> pygame.Surface:
+        """Glow, body and outline of an agent in one surface of size 4 * radius."""
+        def build():
+            glow, fill, outline = PREY_STYLE if entity_class == "prey" else PREDATOR_STYLE
+            center = (radius * 2, radius * 2)
+            surf = pygame.Surface((radius * 4, radius * 4), pygame.SRCALPHA)
+            pygame.draw.circle(surf, glow, center, radius * 2)
+            pygame.draw.circle(surf, fill, center, radius)
+            pygame.draw.circle(surf, outline, center, radius, 2)
+            return surf
+        return self._get(("body", entity_class, radius), build)
+
+
+# Shared by the renderer and BaseAgent.draw
+sprites = SpriteCache()
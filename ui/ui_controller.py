@@ -2,6 +2,24 @@ import pygame
 import math
 from typing import Dict, Any, Callable
 
+# Sidebar slider labels, in drawing order
+SLIDER_LABELS = [
+    ("Speed Min", "prey_speed_min"),
+    ("Speed Max", "prey_speed_max"),
+    ("Agility Min", "prey_agility_min"),
+    ("Agility Max", "prey_agility_max"),
+    ("Vision Min", "prey_vision_min"),
+    ("Vision Max", "prey_vision_max"),
+    ("Speed", "predator_speed"),
+    ("Vision", "predator_vision"),
+    ("Mutation Rate", "mutation_rate"),
+    ("Number of Prey", "num_prey"),
+    ("Number of Predators", "num_predators"),
+]
+
+STATS_HEIGHT = 160
+MAX_SPEED = 16.0
+
 class UIController:
     def __init__(self, config: dict):
         self.config = config
@@ -10,12 +28,18 @@ class UIController:
         # UI State
         self.is_paused = False
         self.show_vision = True
-        self.simulation_speed = 1.0
+        self.simulation_speed = config.get("simulation_speed", 1.0)
         
         # Parameter controls
         self.sliders = {}
         self.buttons = {}
         
+        # Static sidebar chrome, rebuilt only when the window height or width changes
+        self._chrome = None
+        self._chrome_key = None
+        self._fonts = None
+        self._slider_labels = None
+        
         # Stats tracking
         self.current_stats = {
             "alive_prey": 0,
@@ -114,12 +138,24 @@ class UIController:
         self.buttons["toggle_vision"].text = "Show Vision" if not self.show_vision else "Hide Vision"
     
     def _speed_up(self):
-        self.simulation_speed = min(4.0, self.simulation_speed * 2)
-        self.buttons["speed_up"].text = f"{self.simulation_speed:.0f}x"
+        # Past 16x the next step is flat out, drawing only as often as target_fps allows
+        if self.simulation_speed >= MAX_SPEED:
+            self.simulation_speed = math.inf
+        else:
+            self.simulation_speed = min(MAX_SPEED, self.simulation_speed * 2)
+        self.config["simulation_speed"] = self.simulation_speed
+        self.buttons["speed_up"].text = self._speed_label()
     
     def _speed_down(self):
-        self.simulation_speed = max(0.25, self.simulation_speed / 2)
-        self.buttons["speed_down"].text = f"{self.simulation_speed:.1f}x"
+        if math.isinf(self.simulation_speed):
+            self.simulation_speed = MAX_SPEED
+        else:
+            self.simulation_speed = max(0.25, self.simulation_speed / 2)
+        self.config["simulation_speed"] = self.simulation_speed
+        self.buttons["speed_down"].text = self._speed_label()
+    
+    def _speed_label(self):
+        return "Max" if math.isinf(self.simulation_speed) else f"{self.simulation_speed:g}x"
     
     def update_stats(self, env, generation, step):
         """Update current statistics"""
@@ -141,8 +177,8 @@ class UIController:
             "avg_reward": avg_reward,
             "generation": generation,
             "step": step,
-            "total_prey": len(env.prey),
-            "total_predators": len(env.predators)
+            "total_prey": alive_prey,
+            "total_predators": sum(1 for pr in env.predators if pr.alive)
         }
     
     def render(self, screen):
@@ -152,56 +188,63 @@ class UIController:
         self._draw_sidebar(screen, screen_height)
         self._draw_stats_panel(screen, screen_height)
     
+    def _get_fonts(self):
+        if self._fonts is None:
+            self._fonts = {
+                "title": pygame.font.Font(None, 28),
+                "label": pygame.font.Font(None, 20),
+                "small": pygame.font.Font(None, 16),
+                "stats_title": pygame.font.Font(None, 22),
+            }
+        return self._fonts
+    
     def _draw_sidebar(self, screen, screen_height):
-        """Draw control sidebar"""
+        """Draw control sidebar: cached chrome, then the live sliders and buttons"""
+        key = (screen_height, self.sidebar_width)
+        if key != self._chrome_key:
+            self._chrome = self._build_chrome(screen_height)
+            self._chrome_key = key
+        screen.blit(self._chrome, (0, 0))
+        
+        font_small = self._get_fonts()["small"]
+        # Labels overlap the slider above them, so they are blitted in order with the sliders
+        for (_, name), label_surf in zip(SLIDER_LABELS, self._slider_labels):
+            slider = self.sliders[name]
+            screen.blit(label_surf, (slider.rect.x, slider.rect.y - 18))
+            self._draw_slider_value(screen, slider, font_small)
+        
+        # Control Buttons
+        for button in self.buttons.values():
+            button.draw(screen)
+    
+    def _build_chrome(self, screen_height):
+        """Compose everything in the sidebar that does not change between frames"""
+        chrome = pygame.Surface((self.sidebar_width, screen_height))
+        fonts = self._get_fonts()
+        font_title, font_label, font_small = fonts["title"], fonts["label"], fonts["small"]
+        
         # Sidebar background
         sidebar_rect = pygame.Rect(0, 0, self.sidebar_width, screen_height)
-        pygame.draw.rect(screen, (45, 45, 55), sidebar_rect)
-        
-        font_title = pygame.font.Font(None, 28)
-        font_label = pygame.font.Font(None, 20)
-        font_small = pygame.font.Font(None, 16)
+        pygame.draw.rect(chrome, (45, 45, 55), sidebar_rect)
         
         # Title
         title = font_title.render("EVOLVION CONTROL", True, (255, 255, 255))
-        screen.blit(title, (20, 20))
+        chrome.blit(title, (20, 20))
         
-        # Prey Parameters Section
-        y = 70
+        # Section titles
         prey_title = font_label.render("PREY PARAMETERS", True, (100, 200, 255))
-        screen.blit(prey_title, (20, y))
-        
-        # Draw sliders with labels
-        self._draw_labeled_slider(screen, "Speed Min", self.sliders["prey_speed_min"], font_small)
-        self._draw_labeled_slider(screen, "Speed Max", self.sliders["prey_speed_max"], font_small)
-        self._draw_labeled_slider(screen, "Agility Min", self.sliders["prey_agility_min"], font_small)
-        self._draw_labeled_slider(screen, "Agility Max", self.sliders["prey_agility_max"], font_small)
-        self._draw_labeled_slider(screen, "Vision Min", self.sliders["prey_vision_min"], font_small)
-        self._draw_labeled_slider(screen, "Vision Max", self.sliders["prey_vision_max"], font_small)
-        
-        # Predator Parameters Section
+        chrome.blit(prey_title, (20, 70))
         pred_title = font_label.render("PREDATOR PARAMETERS", True, (255, 100, 100))
-        screen.blit(pred_title, (20, 320))
-        
-        self._draw_labeled_slider(screen, "Speed", self.sliders["predator_speed"], font_small)
-        self._draw_labeled_slider(screen, "Vision", self.sliders["predator_vision"], font_small)
-        
-        # Simulation Parameters
+        chrome.blit(pred_title, (20, 320))
         sim_title = font_label.render("SIMULATION", True, (100, 255, 100))
-        screen.blit(sim_title, (20, 410))
+        chrome.blit(sim_title, (20, 410))
         
-        self._draw_labeled_slider(screen, "Mutation Rate", self.sliders["mutation_rate"], font_small)
-        self._draw_labeled_slider(screen, "Number of Prey", self.sliders["num_prey"], font_small)
-        self._draw_labeled_slider(screen, "Number of Predators", self.sliders["num_predators"], font_small)
-        
-        # Control Buttons
-        for button in self.buttons.values():
-            button.draw(screen)
+        self._slider_labels = [font_small.render(label, True, (200, 200, 200)) for label, _ in SLIDER_LABELS]
         
         # Keyboard shortcuts info
         shortcuts_y = max(650, screen_height - 140)
         shortcuts_title = font_small.render("KEYBOARD SHORTCUTS:", True, (200, 200, 200))
-        screen.blit(shortcuts_title, (20, shortcuts_y))
+        chrome.blit(shortcuts_title, (20, shortcuts_y))
         
         shortcuts = [
             "SPACE - Pause/Resume",
@@ -213,14 +256,19 @@ class UIController:
         for i, shortcut in enumerate(shortcuts):
             if shortcuts_y + 20 + i * 16 < screen_height - 10:
                 shortcut_surf = font_small.render(shortcut, True, (150, 150, 150))
-                screen.blit(shortcut_surf, (20, shortcuts_y + 20 + i * 16))
+                chrome.blit(shortcut_surf, (20, shortcuts_y + 20 + i * 16))
+        
+        # Statistics panel frame; the values are drawn each frame on top
+        stats_y = self._stats_y(screen_height)
+        stats_rect = pygame.Rect(10, stats_y, self.sidebar_width - 20, STATS_HEIGHT)
+        pygame.draw.rect(chrome, (35, 35, 45), stats_rect)
+        pygame.draw.rect(chrome, (100, 100, 120), stats_rect, 2)
+        title = fonts["stats_title"].render("LIVE STATISTICS", True, (255, 255, 255))
+        chrome.blit(title, (20, stats_y + 10))
+        return chrome
     
-    def _draw_labeled_slider(self, screen, label, slider, font):
-        """Draw slider with label and value"""
-        # Label
-        label_surf = font.render(label, True, (200, 200, 200))
-        screen.blit(label_surf, (slider.rect.x, slider.rect.y - 18))
-        
+    def _draw_slider_value(self, screen, slider, font):
+        """Draw slider and its current value"""
         # Value
         value_text = f"{slider.value:.2f}" if isinstance(slider.value, float) else str(int(slider.value))
         value_surf = font.render(value_text, True, (255, 255, 255))
@@ -229,21 +277,14 @@ class UIController:
         # Slider
         slider.draw(screen)
     
+    def _stats_y(self, screen_height):
+        return max(screen_height - 300, 630)
+    
     def _draw_stats_panel(self, screen, screen_height):
-        """Draw statistics panel"""
-        stats_height = 160
-        stats_y = max(screen_height - 300, 630)
-        
-        stats_rect = pygame.Rect(10, stats_y, self.sidebar_width - 20, stats_height)
-        pygame.draw.rect(screen, (35, 35, 45), stats_rect)
-        pygame.draw.rect(screen, (100, 100, 120), stats_rect, 2)
-        
-        font_title = pygame.font.Font(None, 22)
-        font_stat = pygame.font.Font(None, 16)
-        
-        # Title
-        title = font_title.render("LIVE STATISTICS", True, (255, 255, 255))
-        screen.blit(title, (20, stats_y + 10))
+        """Draw the live statistics inside the panel frame from the chrome layer"""
+        stats_height = STATS_HEIGHT
+        stats_y = self._stats_y(screen_height)
+        font_stat = self._get_fonts()["small"]
         
         y = stats_y + 35
         stats_text = [
@@ -251,7 +292,7 @@ class UIController:
             f"Prey: {self.current_stats['alive_prey']}/{self.current_stats.get('total_prey', 0)}",
             f"Fitness: {self.current_stats['avg_fitness']:.1f}",
             f"Reward: {self.current_stats['avg_reward']:.2f}",
-            f"Speed: {self.simulation_speed:.1f}x",
+            f"Speed: {self._speed_label()}",
             f"{'⏸ PAUSED' if self.is_paused else '▶ RUNNING'}"
         ]
         